@@ -0,0 +1,29 @@
+"""Compatibility helpers shared across the package.
+
+String-valued enums should subclass :class:`StrEnum`. Members are real ``str``
+instances whose ``str()`` and ``format()`` return the member value, so they can
+be interpolated into log messages and error strings directly::
+
+    print(f"Platform: {platform_info.platform}")
+
+rather than going through ``member.value``.
+"""
+
+import sys
+from enum import Enum
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
+
+    class StrEnum(str, Enum):
+        """Backport of :class:`enum.StrEnum` for Python 3.10."""
+
+        def __str__(self) -> str:
+            return str(self.value)
+
+        def __format__(self, format_spec: str) -> str:
+            return str(self.value).__format__(format_spec)
+
+
+__all__ = ["StrEnum"]
@@ -12,6 +12,7 @@ Each adapter implements the ExternalCLIPort interface and provides:
 - Command execution with timeout and error handling
 """
 
+import asyncio
 import os
 import shutil
 import subprocess
@@ -25,7 +26,7 @@ from ai_meta_orchestrator.ports.external_ports.external_port import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class CLIConfig:
     """Configuration for an external CLI adapter.
 
@@ -50,8 +51,11 @@ class BaseCLIAdapter(ExternalCLIPort):
     This adapter provides common functionality for all CLI integrations:
     - Executable detection
     - Authentication via environment variables
-    - Command execution with subprocess
+    - Command execution with subprocess, blocking or asyncio-based
     - Timeout handling
+
+    The executable path and API key are resolved once at construction; call
+    refresh_environment() after changing PATH or credentials.
     """
 
     def __init__(self, cli_type: ExternalCLIType, config: CLIConfig) -> None:
@@ -64,6 +68,8 @@ class BaseCLIAdapter(ExternalCLIPort):
         self._cli_type = cli_type
         self._config = config
         self._executable_path: str | None = None
+        self._api_key: str | None = None
+        self.refresh_environment()
 
     @property
     def cli_type(self) -> ExternalCLIType:
@@ -83,13 +89,27 @@ class BaseCLIAdapter(ExternalCLIPort):
         """
         return shutil.which(self._config.executable)
 
+    def _resolve_api_key(self) -> str | None:
+        """Read the API key from the environment.
+
+        Returns:
+            API key or None if not set.
+        """
+        if self._config.api_key_env is None:
+            return None
+        return os.environ.get(self._config.api_key_env)
+
+    def refresh_environment(self) -> None:
+        """Re-resolve the CLI executable and API key from the environment."""
+        self._executable_path = self._find_executable()
+        self._api_key = self._resolve_api_key()
+
     def is_available(self) -> bool:
         """Check if the CLI is available.
 
         Returns:
             True if the CLI executable is found.
         """
-        self._executable_path = self._find_executable()
         return self._executable_path is not None
 
     def is_authenticated(self) -> bool:
@@ -100,7 +120,7 @@ class BaseCLIAdapter(ExternalCLIPort):
         """
         if self._config.api_key_env is None:
             return True  # No authentication required
-        return os.environ.get(self._config.api_key_env) is not None
+        return self._api_key is not None
 
     def get_api_key(self) -> str | None:
         """Get the API key from environment.
@@ -108,9 +128,7 @@ class BaseCLIAdapter(ExternalCLIPort):
         Returns:
             API key or None if not set.
         """
-        if self._config.api_key_env is None:
-            return None
-        return os.environ.get(self._config.api_key_env)
+        return self._api_key
 
     def _build_command(
         self, command: str, args: list[str] | None = None, **kwargs: Any
@@ -150,27 +168,17 @@ class BaseCLIAdapter(ExternalCLIPort):
         env = os.environ.copy()
         return env
 
-    def execute(
-        self, command: str, args: list[str] | None = None, **kwargs: Any
-    ) -> CLICommandResult:
-        """Execute a CLI command.
-
-        Args:
-            command: The command to execute.
-            args: Additional command arguments (passed safely without shell interpretation).
-            **kwargs: Additional arguments:
-                - timeout: Override default timeout
-                - input_text: Text to pass to stdin
-                - working_dir: Override working directory
+    def _check_ready(self) -> CLICommandResult | None:
+        """Check that the CLI can be invoked.
 
         Returns:
-            CLICommandResult containing output or error.
+            A failed CLICommandResult describing the problem, or None if ready.
         """
         if not self.is_available():
             return CLICommandResult(
                 success=False,
                 output="",
-                error=f"{self._cli_type.value} CLI not found. "
+                error=f"{self._cli_type} CLI not found. "
                       f"Please install '{self._config.executable}'.",
                 exit_code=127,
             )
@@ -184,6 +192,28 @@ class BaseCLIAdapter(ExternalCLIPort):
                 exit_code=1,
             )
 
+        return None
+
+    def execute(
+        self, command: str, args: list[str] | None = None, **kwargs: Any
+    ) -> CLICommandResult:
+        """Execute a CLI command.
+
+        Args:
+            command: The command to execute.
+            args: Additional command arguments (passed safely without shell interpretation).
+            **kwargs: Additional arguments:
+                - timeout: Override default timeout
+                - input_text: Text to pass to stdin
+                - working_dir: Override working directory
+
+        Returns:
+            CLICommandResult containing output or error.
+        """
+        not_ready = self._check_ready()
+        if not_ready is not None:
+            return not_ready
+
         timeout = kwargs.get("timeout", self._config.timeout)
         input_text = kwargs.get("input_text")
         working_dir = kwargs.get("working_dir", self._config.working_dir)
@@ -231,6 +261,91 @@ class BaseCLIAdapter(ExternalCLIPort):
                 exit_code=1,
             )
 
+    async def execute_async(
+        self, command: str, args: list[str] | None = None, **kwargs: Any
+    ) -> CLICommandResult:
+        """Execute a CLI command as an asyncio subprocess.
+
+        Accepts the same arguments as execute(). Availability and
+        authentication checks may themselves spawn processes, so they run in a
+        worker thread to keep the event loop responsive.
+
+        Args:
+            command: The command to execute.
+            args: Additional command arguments (passed safely without shell interpretation).
+            **kwargs: Additional arguments:
+                - timeout: Override default timeout
+                - input_text: Text to pass to stdin
+                - working_dir: Override working directory
+
+        Returns:
+            CLICommandResult containing output or error.
+        """
+        not_ready = await asyncio.to_thread(self._check_ready)
+        if not_ready is not None:
+            return not_ready
+
+        timeout = kwargs.get("timeout", self._config.timeout)
+        input_text = kwargs.get("input_text")
+        working_dir = kwargs.get("working_dir", self._config.working_dir)
+
+        cmd = self._build_command(command, args=args)
+        env = self._get_env()
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE if input_text is not None else None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=working_dir,
+                env=env,
+            )
+        except FileNotFoundError:
+            return CLICommandResult(
+                success=False,
+                output="",
+                error=f"CLI executable not found: {self._config.executable}",
+                exit_code=127,
+            )
+        except Exception as e:
+            return CLICommandResult(
+                success=False,
+                output="",
+                error=f"Error executing command: {e!s}",
+                exit_code=1,
+            )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(input_text.encode() if input_text is not None else None),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return CLICommandResult(
+                success=False,
+                output="",
+                error=f"Command timed out after {timeout} seconds",
+                exit_code=124,
+            )
+        except BaseException:
+            # Cancelled (e.g. by gather or a distributor cleaning up): do not
+            # leave the child process running.
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+
+        returncode = process.returncode or 0
+        return CLICommandResult(
+            success=returncode == 0,
+            output=stdout.decode(errors="replace"),
+            error=stderr.decode(errors="replace") if returncode != 0 else "",
+            exit_code=returncode,
+        )
+
 
 class GeminiCLIAdapter(BaseCLIAdapter):
     """Adapter for Google Gemini CLI integration.
@@ -278,21 +393,11 @@ class GeminiCLIAdapter(BaseCLIAdapter):
         )
         super().__init__(ExternalCLIType.GEMINI, config)
 
-    def is_authenticated(self) -> bool:
-        """Check if authentication credentials are available.
+    def _resolve_api_key(self) -> str | None:
+        """Read the API key from the environment.
 
         Checks multiple possible environment variable names for Gemini API key.
 
-        Returns:
-            True if any API key environment variable is set.
-        """
-        return any(os.environ.get(env_var) for env_var in self.API_KEY_ENVS)
-
-    def get_api_key(self) -> str | None:
-        """Get the API key from environment.
-
-        Checks multiple possible environment variable names.
-
         Returns:
             API key or None if not set.
         """
@@ -449,25 +554,27 @@ class CopilotCLIAdapter(BaseCLIAdapter):
         )
         super().__init__(ExternalCLIType.COPILOT, config)
 
-    def is_available(self) -> bool:
-        """Check if gh copilot is available.
+    def refresh_environment(self) -> None:
+        """Re-resolve gh and forget cached extension and auth checks."""
+        super().refresh_environment()
+        self._copilot_available: bool | None = None
+        self._gh_authenticated: bool | None = None
 
-        Checks for both gh CLI and copilot extension.
+    def _run_gh_check(self, *args: str) -> bool:
+        """Run a gh subcommand and report whether it succeeded.
+
+        Args:
+            *args: Arguments passed to gh.
 
         Returns:
-            True if gh copilot is available.
+            True if gh is available and the command exited with status 0.
         """
-        # First check if gh is available
-        gh_path = shutil.which(self._config.executable)
-        if not gh_path:
+        if not self._executable_path:
             return False
 
-        self._executable_path = gh_path
-
-        # Check if copilot extension is installed
         try:
             result = subprocess.run(
-                [gh_path, "copilot", "--help"],
+                [self._executable_path, *args],
                 capture_output=True,
                 text=True,
                 timeout=10,
@@ -477,27 +584,30 @@ class CopilotCLIAdapter(BaseCLIAdapter):
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
 
+    def is_available(self) -> bool:
+        """Check if gh copilot is available.
+
+        Checks for both gh CLI and copilot extension. The result is cached
+        until refresh_environment() is called.
+
+        Returns:
+            True if gh copilot is available.
+        """
+        if self._copilot_available is None:
+            self._copilot_available = self._run_gh_check("copilot", "--help")
+        return self._copilot_available
+
     def is_authenticated(self) -> bool:
         """Check if GitHub authentication is available.
 
+        The result is cached until refresh_environment() is called.
+
         Returns:
             True if gh auth status indicates logged in.
         """
-        gh_path = self._executable_path or shutil.which(self._config.executable)
-        if not gh_path:
-            return False
-
-        try:
-            result = subprocess.run(
-                [gh_path, "auth", "status"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=False,
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        if self._gh_authenticated is None:
+            self._gh_authenticated = self._run_gh_check("auth", "status")
+        return self._gh_authenticated
 
     def suggest(self, query: str, **kwargs: Any) -> CLICommandResult:
         """Get command suggestions from Copilot.
@@ -547,6 +657,13 @@ class PlaceholderCLIAdapter(BaseCLIAdapter):
         super().__init__(cli_type, config)
 
 
+_ADAPTER_CLASSES: dict[ExternalCLIType, type[BaseCLIAdapter]] = {
+    ExternalCLIType.GEMINI: GeminiCLIAdapter,
+    ExternalCLIType.CODEX: CodexCLIAdapter,
+    ExternalCLIType.COPILOT: CopilotCLIAdapter,
+}
+
+
 def get_cli_adapter(
     cli_type: ExternalCLIType,
     **kwargs: Any,
@@ -560,11 +677,7 @@ def get_cli_adapter(
     Returns:
         An ExternalCLIPort implementation.
     """
-    if cli_type == ExternalCLIType.GEMINI:
-        return GeminiCLIAdapter(**kwargs)
-    elif cli_type == ExternalCLIType.CODEX:
-        return CodexCLIAdapter(**kwargs)
-    elif cli_type == ExternalCLIType.COPILOT:
-        return CopilotCLIAdapter(**kwargs)
-    else:
+    adapter_class = _ADAPTER_CLASSES.get(cli_type)
+    if adapter_class is None:
         return PlaceholderCLIAdapter(cli_type)
+    return adapter_class(**kwargs)
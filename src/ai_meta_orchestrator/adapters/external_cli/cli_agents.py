@@ -7,6 +7,9 @@ Each CLI agent implements the AgentPort interface and delegates
 task execution to the underlying CLI adapter.
 """
 
+from dataclasses import replace
+from functools import lru_cache
+
 from ai_meta_orchestrator.adapters.external_cli.cli_adapters import (
     BaseCLIAdapter,
     CodexCLIAdapter,
@@ -22,6 +25,47 @@ from ai_meta_orchestrator.ports.external_ports.external_port import (
 )
 
 
+@lru_cache(maxsize=64)
+def _default_config(
+    agent_cls: "type[ExternalCLIAgent]",
+    cli_type: ExternalCLIType,
+    role: AgentRole,
+) -> AgentConfig:
+    """Return the cached default configuration for an agent class and role.
+
+    The cached instance is a template; agents take a copy of it with their
+    own tools list (see ExternalCLIAgent.__init__).
+    """
+    return agent_cls._create_default_config(role, cli_type)
+
+
+@lru_cache(maxsize=1024)
+def _format_prompt(name: str, description: str, expected_output: str, context: str) -> str:
+    """Build a CLI prompt from task fields.
+
+    Args:
+        name: The task name.
+        description: The task description.
+        expected_output: The expected output, or an empty string.
+        context: The rendered task context, or an empty string.
+
+    Returns:
+        Formatted prompt string.
+    """
+    parts = [
+        f"Task: {name}",
+        f"Description: {description}",
+    ]
+
+    if expected_output:
+        parts.append(f"Expected Output: {expected_output}")
+
+    if context:
+        parts.append(f"Context: {context}")
+
+    return "\n\n".join(parts)
+
+
 class ExternalCLIAgent(AgentPort):
     """Base agent wrapper for external CLI tools.
 
@@ -44,20 +88,29 @@ class ExternalCLIAgent(AgentPort):
         """
         self._cli_adapter = cli_adapter
         self._role = role
-        self._config = config or self._create_default_config()
-
-    def _create_default_config(self) -> AgentConfig:
+        if config is None:
+            default = _default_config(type(self), cli_adapter.cli_type, role)
+            config = replace(default, tools=list(default.tools))
+        self._config = config
+
+    @classmethod
+    def _create_default_config(
+        cls, role: AgentRole, cli_type: ExternalCLIType
+    ) -> AgentConfig:
         """Create a default configuration based on CLI type.
 
+        Args:
+            role: The agent role to configure.
+            cli_type: The CLI type backing the agent.
+
         Returns:
             Default agent configuration.
         """
-        cli_type = self._cli_adapter.cli_type
         return AgentConfig(
-            role=self._role,
-            goal=f"Execute tasks using {cli_type.value} CLI capabilities",
+            role=role,
+            goal=f"Execute tasks using {cli_type} CLI capabilities",
             backstory=(
-                f"You are an AI agent powered by {cli_type.value} CLI. "
+                f"You are an AI agent powered by {cli_type} CLI. "
                 "You execute tasks by leveraging the CLI's AI capabilities."
             ),
             verbose=True,
@@ -99,20 +152,13 @@ class ExternalCLIAgent(AgentPort):
         Returns:
             Formatted prompt string.
         """
-        parts = [
-            f"Task: {task.name}",
-            f"Description: {task.description}",
-        ]
-
-        if task.expected_output:
-            parts.append(f"Expected Output: {task.expected_output}")
-
-        if task.metadata:
-            context = task.metadata.get("context")
-            if context:
-                parts.append(f"Context: {context}")
-
-        return "\n\n".join(parts)
+        context = task.metadata.get("context") if task.metadata else None
+        return _format_prompt(
+            task.name,
+            task.description,
+            task.expected_output,
+            str(context) if context else "",
+        )
 
     def execute_task(self, task: Task) -> TaskResult:
         """Execute a task using the CLI.
@@ -126,14 +172,14 @@ class ExternalCLIAgent(AgentPort):
         if not self._cli_adapter.is_available():
             return TaskResult(
                 success=False,
-                error=f"{self._cli_adapter.cli_type.value} CLI is not available",
+                error=f"{self._cli_adapter.cli_type} CLI is not available",
                 metadata={"task_id": str(task.id), "cli_type": self._cli_adapter.cli_type.value},
             )
 
         if not self._cli_adapter.is_authenticated():
             return TaskResult(
                 success=False,
-                error=f"Authentication required for {self._cli_adapter.cli_type.value} CLI",
+                error=f"Authentication required for {self._cli_adapter.cli_type} CLI",
                 metadata={"task_id": str(task.id), "cli_type": self._cli_adapter.cli_type.value},
             )
 
@@ -215,10 +261,13 @@ class GeminiAgent(ExternalCLIAgent):
         adapter = GeminiCLIAdapter(**cli_kwargs)
         super().__init__(adapter, role, config)
 
-    def _create_default_config(self) -> AgentConfig:
+    @classmethod
+    def _create_default_config(
+        cls, role: AgentRole, cli_type: ExternalCLIType
+    ) -> AgentConfig:
         """Create Gemini-specific default configuration."""
         return AgentConfig(
-            role=self._role,
+            role=role,
             goal="Execute development tasks using Google Gemini AI",
             backstory=(
                 "You are a highly capable AI agent powered by Google's Gemini. "
@@ -283,10 +332,13 @@ class CodexAgent(ExternalCLIAgent):
         adapter = CodexCLIAdapter(**cli_kwargs)
         super().__init__(adapter, role, config)
 
-    def _create_default_config(self) -> AgentConfig:
+    @classmethod
+    def _create_default_config(
+        cls, role: AgentRole, cli_type: ExternalCLIType
+    ) -> AgentConfig:
         """Create Codex-specific default configuration."""
         return AgentConfig(
-            role=self._role,
+            role=role,
             goal="Execute development tasks using OpenAI's code models",
             backstory=(
                 "You are an AI agent powered by OpenAI's advanced code models. "
@@ -351,10 +403,13 @@ class CopilotAgent(ExternalCLIAgent):
         adapter = CopilotCLIAdapter(**cli_kwargs)
         super().__init__(adapter, role, config)
 
-    def _create_default_config(self) -> AgentConfig:
+    @classmethod
+    def _create_default_config(
+        cls, role: AgentRole, cli_type: ExternalCLIType
+    ) -> AgentConfig:
         """Create Copilot-specific default configuration."""
         return AgentConfig(
-            role=self._role,
+            role=role,
             goal="Execute tasks using GitHub Copilot CLI",
             backstory=(
                 "You are an AI agent powered by GitHub Copilot. "
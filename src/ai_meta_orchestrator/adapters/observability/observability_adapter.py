@@ -5,13 +5,18 @@ This module provides observability implementations including:
 - OpenTelemetryAdapter: Full OpenTelemetry support for production
 """
 
+import itertools
 import logging
 import time
+from collections.abc import Sequence
 from typing import Any
-from uuid import uuid4
 
 from ai_meta_orchestrator.ports.external_ports.external_port import ObservabilityPort
 
+# Span IDs only need to be unique within the process, so a shared counter is
+# enough; next() on itertools.count is atomic under the GIL.
+_SPAN_COUNTER = itertools.count(1)
+
 
 class PlaceholderObservabilityAdapter(ObservabilityPort):
     """Placeholder observability adapter.
@@ -53,6 +58,44 @@ class PlaceholderObservabilityAdapter(ObservabilityPort):
             extra={"metric_tags": tags or {}},
         )
 
+    def log_events(self, events: Sequence[tuple[str, dict[str, Any]]]) -> None:
+        """Log several events as a single log record.
+
+        Args:
+            events: (event_name, data) pairs to log.
+        """
+        if not events or not self._logger.isEnabledFor(logging.INFO):
+            return
+        self._logger.info(
+            f"Events: {', '.join(event_name for event_name, _ in events)}",
+            extra={"event_data": [data for _, data in events]},
+        )
+
+    def record_metrics(
+        self,
+        names: Sequence[str],
+        values: Sequence[float],
+        tags: Sequence[dict[str, str] | None] | None = None,
+    ) -> None:
+        """Record several metrics as a single log record.
+
+        Args:
+            names: Names of the metrics.
+            values: Metric values, aligned with ``names``.
+            tags: Optional per-metric tags, aligned with ``names``.
+
+        Raises:
+            ValueError: If the sequences have different lengths.
+        """
+        if len(values) != len(names) or (tags is not None and len(tags) != len(names)):
+            raise ValueError("names, values and tags must have the same length")
+        if not names or not self._logger.isEnabledFor(logging.DEBUG):
+            return
+        self._logger.debug(
+            f"Metrics: {', '.join(f'{n}={v}' for n, v in zip(names, values, strict=True))}",
+            extra={"metric_tags": [t or {} for t in tags] if tags is not None else []},
+        )
+
     def start_span(self, operation_name: str) -> str:
         """Start a tracing span.
 
@@ -62,7 +105,7 @@ class PlaceholderObservabilityAdapter(ObservabilityPort):
         Returns:
             The span ID.
         """
-        span_id = str(uuid4())
+        span_id = str(next(_SPAN_COUNTER))
         self._spans[span_id] = {
             "operation": operation_name,
             "status": "in_progress",
@@ -116,6 +159,7 @@ class OpenTelemetryAdapter(ObservabilityPort):
         self._span_map: dict[str, Any] = {}
         self._tracer: Any = None
         self._meter: Any = None
+        self._counters: dict[str, Any] = {}
         self._initialized = False
 
         # Try to initialize OpenTelemetry
@@ -176,8 +220,7 @@ class OpenTelemetryAdapter(ObservabilityPort):
         """
         if self._meter is not None:
             try:
-                counter = self._meter.create_counter(metric_name)
-                counter.add(value, tags or {})
+                self._get_counter(metric_name).add(value, tags or {})
             except Exception as e:
                 self._logger.debug(f"Failed to record metric: {e}")
         else:
@@ -186,6 +229,21 @@ class OpenTelemetryAdapter(ObservabilityPort):
                 extra={"metric_tags": tags or {}},
             )
 
+    def _get_counter(self, metric_name: str) -> Any:
+        """Get the counter instrument for a metric, creating it on first use.
+
+        Args:
+            metric_name: Name of the metric.
+
+        Returns:
+            The OpenTelemetry counter.
+        """
+        counter = self._counters.get(metric_name)
+        if counter is None:
+            counter = self._meter.create_counter(metric_name)
+            self._counters[metric_name] = counter
+        return counter
+
     def start_span(self, operation_name: str) -> str:
         """Start an OpenTelemetry span.
 
@@ -195,7 +253,7 @@ class OpenTelemetryAdapter(ObservabilityPort):
         Returns:
             The span ID.
         """
-        span_id = str(uuid4())
+        span_id = str(next(_SPAN_COUNTER))
 
         if self._tracer is not None and self._enable_tracing:
             try:
@@ -9,8 +9,9 @@ import json
 import logging
 import sqlite3
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime, time
 from typing import Any
 from uuid import UUID
 
@@ -25,12 +26,96 @@ from ai_meta_orchestrator.domain.workflows.workflow_models import (
 )
 
 
+def _json_default(obj: Any) -> str:
+    """Serialize values that JSON does not support natively.
+
+    Dates and times use ISO 8601, matching orjson's native output, so the
+    stored text is the same whichever encoder wrote it.
+
+    Args:
+        obj: The value to serialize.
+
+    Returns:
+        A string representation of the value.
+    """
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+# Compact, non-ASCII-escaping output matches what orjson writes
+_STDLIB_DUMPS_KWARGS: dict[str, Any] = {
+    "default": _json_default,
+    "separators": (",", ":"),
+    "ensure_ascii": False,
+}
+
+# JSON columns are encoded with orjson when available (installed with the api
+# extra); the stdlib json module is used otherwise, and for values orjson
+# rejects such as integers wider than 64 bits.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        """Serialize a value to JSON text, preferring orjson."""
+        try:
+            return orjson.dumps(
+                obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            return json.dumps(obj, **_STDLIB_DUMPS_KWARGS)
+
+    def _loads(data: str) -> Any:
+        """Deserialize JSON text, preferring orjson."""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity tokens written by the stdlib encoder
+            return json.loads(data)
+
+except ImportError:
+
+    def _dumps(obj: Any) -> str:
+        """Serialize a value to JSON text."""
+        return json.dumps(obj, **_STDLIB_DUMPS_KWARGS)
+
+    def _loads(data: str) -> Any:
+        """Deserialize JSON text."""
+        return json.loads(data)
+
+
+# Explicit column lists for SELECTs. _row_to_workflow and _row_to_task unpack
+# rows positionally, so the order here must match those methods.
+_WORKFLOW_COLUMNS = (
+    "id, name, description, status, mode, max_iterations, enable_evaluation, "
+    "enable_correction_loop, verbose, memory, current_iteration, created_at, "
+    "started_at, completed_at, metadata"
+)
+_TASK_COLUMNS = (
+    "id, name, description, assigned_to, status, priority, expected_output, "
+    "revision_count, max_revisions, created_at, updated_at, context_tasks, metadata"
+)
+
+_INSERT_TASK_SQL = """
+    INSERT OR REPLACE INTO tasks
+    (id, workflow_id, name, description, assigned_to, status, priority,
+     expected_output, revision_count, max_revisions, created_at, updated_at,
+     context_tasks, metadata)
+    VALUES
+    (:id, :workflow_id, :name, :description, :assigned_to, :status, :priority,
+     :expected_output, :revision_count, :max_revisions, :created_at, :updated_at,
+     :context_tasks, :metadata)
+"""
+
+
 @dataclass
 class PersistenceConfig:
     """Configuration for persistence adapters.
 
     Attributes:
-        database_path: Path to the SQLite database file.
+        database_path: Path to the SQLite database file, or a ``file:`` URI
+            (e.g. ``file:name?mode=memory&cache=shared`` for an in-memory
+            database).
         auto_migrate: Whether to auto-migrate the database schema.
         connection_timeout: Connection timeout in seconds.
     """
@@ -243,8 +328,16 @@ class SQLitePersistence(PersistencePort):
             self._connection = sqlite3.connect(
                 self._config.database_path,
                 timeout=self._config.connection_timeout,
+                uri=self._config.database_path.startswith("file:"),
             )
             self._connection.row_factory = sqlite3.Row
+            # WAL lets readers proceed while a write is in progress and is
+            # crash-safe with synchronous=NORMAL. In-memory databases ignore
+            # the journal mode.
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("PRAGMA temp_store=MEMORY")
+            self._connection.execute("PRAGMA mmap_size=268435456")
         return self._connection
 
     def _init_database(self) -> None:
@@ -293,6 +386,9 @@ class SQLitePersistence(PersistencePort):
                 FOREIGN KEY (workflow_id) REFERENCES workflows (id)
             )
         """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_workflow_id ON tasks (workflow_id)"
+        )
 
         # Create workflow_results table
         cursor.execute("""
@@ -329,71 +425,112 @@ class SQLitePersistence(PersistencePort):
             "created_at": workflow.created_at.isoformat(),
             "started_at": workflow.started_at.isoformat() if workflow.started_at else None,
             "completed_at": workflow.completed_at.isoformat() if workflow.completed_at else None,
-            "metadata": json.dumps(workflow.metadata),
+            "metadata": _dumps(workflow.metadata),
         }
 
-    def _row_to_workflow(self, row: sqlite3.Row) -> Workflow:
-        """Convert a database row to a workflow."""
+    def _row_to_workflow(self, row: Iterable[Any]) -> Workflow:
+        """Convert a database row selected with _WORKFLOW_COLUMNS to a workflow.
+
+        Tasks and results are not loaded; see _load_workflows.
+        """
+        (
+            workflow_id,
+            name,
+            description,
+            status,
+            mode,
+            max_iterations,
+            enable_evaluation,
+            enable_correction_loop,
+            verbose,
+            memory,
+            current_iteration,
+            created_at,
+            started_at,
+            completed_at,
+            metadata,
+        ) = row
+
         config = WorkflowConfig(
-            mode=WorkflowMode(row["mode"]),
-            max_iterations=row["max_iterations"],
-            enable_evaluation=bool(row["enable_evaluation"]),
-            enable_correction_loop=bool(row["enable_correction_loop"]),
-            verbose=bool(row["verbose"]),
-            memory=bool(row["memory"]),
+            mode=WorkflowMode(mode),
+            max_iterations=max_iterations,
+            enable_evaluation=bool(enable_evaluation),
+            enable_correction_loop=bool(enable_correction_loop),
+            verbose=bool(verbose),
+            memory=bool(memory),
         )
 
         workflow = Workflow(
-            id=UUID(row["id"]),
-            name=row["name"],
-            description=row["description"] or "",
+            id=UUID(workflow_id),
+            name=name,
+            description=description or "",
             config=config,
-            status=WorkflowStatus(row["status"]),
-            current_iteration=row["current_iteration"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            started_at=(
-                datetime.fromisoformat(row["started_at"])
-                if row["started_at"]
-                else None
-            ),
-            completed_at=(
-                datetime.fromisoformat(row["completed_at"])
-                if row["completed_at"]
-                else None
-            ),
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            status=WorkflowStatus(status),
+            current_iteration=current_iteration,
+            created_at=datetime.fromisoformat(created_at),
+            started_at=datetime.fromisoformat(started_at) if started_at else None,
+            completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+            metadata=_loads(metadata) if metadata else {},
         )
 
-        # Load tasks for this workflow
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return workflow
+
+    def _load_workflows(self, rows: Iterable[Iterable[Any]]) -> list[Workflow]:
+        """Convert workflow rows to workflows with their tasks and results.
+
+        Tasks and results for all rows are fetched with one query each rather
+        than one pair of queries per workflow.
+
+        Args:
+            rows: Rows selected with _WORKFLOW_COLUMNS.
+
+        Returns:
+            The workflows, in row order.
+        """
+        workflows = [self._row_to_workflow(row) for row in rows]
+        if not workflows:
+            return workflows
+
+        by_id = {str(workflow.id): workflow for workflow in workflows}
+        placeholders = ", ".join("?" * len(by_id))
+        ids = tuple(by_id)
+        cursor = self._get_connection().cursor()
+
         cursor.execute(
-            "SELECT * FROM tasks WHERE workflow_id = ?",
-            (str(workflow.id),),
+            f"SELECT workflow_id, {_TASK_COLUMNS} FROM tasks "
+            f"WHERE workflow_id IN ({placeholders}) ORDER BY rowid",
+            ids,
         )
+        for workflow_id, *task_row in cursor:
+            by_id[workflow_id].add_task(self._row_to_task(task_row))
 
-        for task_row in cursor.fetchall():
-            task = self._row_to_task(task_row)
-            workflow.tasks.append(task)
-
-        # Load result if exists
         cursor.execute(
-            "SELECT * FROM workflow_results WHERE workflow_id = ?",
-            (str(workflow.id),),
+            "SELECT workflow_id, success, tasks_completed, tasks_failed, "
+            "total_iterations, duration_seconds, outputs, errors "
+            f"FROM workflow_results WHERE workflow_id IN ({placeholders})",
+            ids,
         )
-        result_row = cursor.fetchone()
-        if result_row:
-            workflow.result = WorkflowResult(
-                success=bool(result_row["success"]),
-                tasks_completed=result_row["tasks_completed"],
-                tasks_failed=result_row["tasks_failed"],
-                total_iterations=result_row["total_iterations"],
-                duration_seconds=result_row["duration_seconds"],
-                outputs=json.loads(result_row["outputs"]) if result_row["outputs"] else {},
-                errors=json.loads(result_row["errors"]) if result_row["errors"] else [],
+        for (
+            workflow_id,
+            success,
+            tasks_completed,
+            tasks_failed,
+            total_iterations,
+            duration_seconds,
+            outputs,
+            errors,
+        ) in cursor:
+            by_id[workflow_id].result = WorkflowResult(
+                success=bool(success),
+                tasks_completed=tasks_completed,
+                tasks_failed=tasks_failed,
+                total_iterations=total_iterations,
+                duration_seconds=duration_seconds,
+                outputs=_loads(outputs) if outputs else {},
+                errors=_loads(errors) if errors else [],
             )
 
-        return workflow
+        return workflows
 
     def _task_to_row(self, task: Task, workflow_id: UUID) -> dict[str, Any]:
         """Convert a task to a database row."""
@@ -410,53 +547,66 @@ class SQLitePersistence(PersistencePort):
             "max_revisions": task.max_revisions,
             "created_at": task.created_at.isoformat(),
             "updated_at": task.updated_at.isoformat(),
-            "context_tasks": json.dumps([str(t) for t in task.context_tasks]),
-            "metadata": json.dumps(task.metadata),
+            "context_tasks": _dumps([str(t) for t in task.context_tasks]),
+            "metadata": _dumps(task.metadata),
         }
 
-    def _row_to_task(self, row: sqlite3.Row) -> Task:
-        """Convert a database row to a task."""
+    def _row_to_task(self, row: Iterable[Any]) -> Task:
+        """Convert a database row selected with _TASK_COLUMNS to a task."""
+        (
+            task_id,
+            name,
+            description,
+            assigned_to,
+            status,
+            priority,
+            expected_output,
+            revision_count,
+            max_revisions,
+            created_at,
+            updated_at,
+            context_tasks,
+            metadata,
+        ) = row
+
         return Task(
-            id=UUID(row["id"]),
-            name=row["name"],
-            description=row["description"] or "",
-            assigned_to=AgentRole(row["assigned_to"]),
-            status=TaskStatus(row["status"]),
-            priority=TaskPriority(row["priority"]),
-            expected_output=row["expected_output"] or "",
-            revision_count=row["revision_count"],
-            max_revisions=row["max_revisions"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
-            context_tasks=[UUID(t) for t in json.loads(row["context_tasks"] or "[]")],
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            id=UUID(task_id),
+            name=name,
+            description=description or "",
+            assigned_to=AgentRole(assigned_to),
+            status=TaskStatus(status),
+            priority=TaskPriority(priority),
+            expected_output=expected_output or "",
+            revision_count=revision_count,
+            max_revisions=max_revisions,
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+            context_tasks=[UUID(t) for t in _loads(context_tasks or "[]")],
+            metadata=_loads(metadata) if metadata else {},
         )
 
     def save_workflow(self, workflow: Workflow) -> bool:
         """Save a workflow to the database."""
         try:
             conn = self._get_connection()
-            cursor = conn.cursor()
-
             row = self._workflow_to_row(workflow)
+            task_rows = [self._task_to_row(task, workflow.id) for task in workflow.tasks]
+
+            # Workflow and tasks are written in a single transaction
+            with conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO workflows
+                    (id, name, description, status, mode, max_iterations,
+                     enable_evaluation, enable_correction_loop, verbose, memory,
+                     current_iteration, created_at, started_at, completed_at, metadata)
+                    VALUES
+                    (:id, :name, :description, :status, :mode, :max_iterations,
+                     :enable_evaluation, :enable_correction_loop, :verbose, :memory,
+                     :current_iteration, :created_at, :started_at, :completed_at,
+                     :metadata)
+                """, row)
+                conn.executemany(_INSERT_TASK_SQL, task_rows)
 
-            # Insert or replace workflow
-            cursor.execute("""
-                INSERT OR REPLACE INTO workflows
-                (id, name, description, status, mode, max_iterations,
-                 enable_evaluation, enable_correction_loop, verbose, memory,
-                 current_iteration, created_at, started_at, completed_at, metadata)
-                VALUES
-                (:id, :name, :description, :status, :mode, :max_iterations,
-                 :enable_evaluation, :enable_correction_loop, :verbose, :memory,
-                 :current_iteration, :created_at, :started_at, :completed_at, :metadata)
-            """, row)
-
-            # Save all tasks
-            for task in workflow.tasks:
-                self.save_task(task, workflow.id)
-
-            conn.commit()
             self._logger.debug(f"Saved workflow {workflow.id} to database")
             return True
         except Exception as e:
@@ -470,13 +620,13 @@ class SQLitePersistence(PersistencePort):
             cursor = conn.cursor()
 
             cursor.execute(
-                "SELECT * FROM workflows WHERE id = ?",
+                f"SELECT {_WORKFLOW_COLUMNS} FROM workflows WHERE id = ?",
                 (str(workflow_id),),
             )
             row = cursor.fetchone()
 
             if row:
-                return self._row_to_workflow(row)
+                return self._load_workflows([row])[0]
             return None
         except Exception as e:
             self._logger.error(f"Failed to get workflow: {e}")
@@ -488,23 +638,19 @@ class SQLitePersistence(PersistencePort):
         limit: int = 100,
         offset: int = 0,
     ) -> list[Workflow]:
-        """List workflows from the database."""
+        """List workflows from the database, oldest first."""
         try:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            if status:
-                cursor.execute(
-                    "SELECT * FROM workflows WHERE status = ? LIMIT ? OFFSET ?",
-                    (status.value, limit, offset),
-                )
-            else:
-                cursor.execute(
-                    "SELECT * FROM workflows LIMIT ? OFFSET ?",
-                    (limit, offset),
-                )
-
-            return [self._row_to_workflow(row) for row in cursor.fetchall()]
+            cursor.execute(
+                f"SELECT {_WORKFLOW_COLUMNS} FROM workflows "
+                "WHERE (?1 IS NULL OR status = ?1) "
+                "ORDER BY created_at, rowid LIMIT ?2 OFFSET ?3",
+                (status.value if status else None, limit, offset),
+            )
+
+            return self._load_workflows(cursor.fetchall())
         except Exception as e:
             self._logger.error(f"Failed to list workflows: {e}")
             return []
@@ -547,16 +693,7 @@ class SQLitePersistence(PersistencePort):
 
             row = self._task_to_row(task, workflow_id)
 
-            cursor.execute("""
-                INSERT OR REPLACE INTO tasks
-                (id, workflow_id, name, description, assigned_to, status, priority,
-                 expected_output, revision_count, max_revisions, created_at, updated_at,
-                 context_tasks, metadata)
-                VALUES
-                (:id, :workflow_id, :name, :description, :assigned_to, :status, :priority,
-                 :expected_output, :revision_count, :max_revisions, :created_at, :updated_at,
-                 :context_tasks, :metadata)
-            """, row)
+            cursor.execute(_INSERT_TASK_SQL, row)
 
             conn.commit()
             return True
@@ -571,7 +708,7 @@ class SQLitePersistence(PersistencePort):
             cursor = conn.cursor()
 
             cursor.execute(
-                "SELECT * FROM tasks WHERE id = ?",
+                f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id = ?",
                 (str(task_id),),
             )
             row = cursor.fetchone()
@@ -605,8 +742,8 @@ class SQLitePersistence(PersistencePort):
                 result.tasks_failed,
                 result.total_iterations,
                 result.duration_seconds,
-                json.dumps(result.outputs),
-                json.dumps(result.errors),
+                _dumps(result.outputs),
+                _dumps(result.errors),
             ))
 
             conn.commit()
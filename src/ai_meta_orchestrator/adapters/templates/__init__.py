@@ -1,6 +1,7 @@
 """Workflow templates adapters module."""
 
 from ai_meta_orchestrator.adapters.templates.builtin_templates import (
+    BUILTIN_TEMPLATES,
     create_code_review_template,
     create_documentation_template,
     create_full_development_template,
@@ -10,6 +11,7 @@ from ai_meta_orchestrator.adapters.templates.builtin_templates import (
 )
 
 __all__ = [
+    "BUILTIN_TEMPLATES",
     "create_code_review_template",
     "create_documentation_template",
     "create_full_development_template",
@@ -4,6 +4,9 @@ This module provides pre-configured workflow templates for common
 development scenarios.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from ai_meta_orchestrator.domain.agents.agent_models import AgentRole
 from ai_meta_orchestrator.domain.tasks.task_models import TaskPriority
 from ai_meta_orchestrator.domain.templates.template_models import (
@@ -366,19 +369,35 @@ def create_security_audit_template() -> WorkflowTemplate:
     return template
 
 
+# Built-in templates keyed by name, built once at import. Template IDs are
+# therefore stable for the lifetime of the process.
+BUILTIN_TEMPLATES: Mapping[str, WorkflowTemplate] = MappingProxyType(
+    {
+        template.name: template
+        for template in (
+            create_full_development_template(),
+            create_quick_implementation_template(),
+            create_code_review_template(),
+            create_documentation_template(),
+            create_security_audit_template(),
+        )
+    }
+)
+
+
 def get_default_template_registry() -> WorkflowTemplateRegistry:
     """Get a registry with all built-in templates registered.
 
+    Each call returns a new registry populated from BUILTIN_TEMPLATES, so
+    callers can register or unregister templates without affecting others.
+
     Returns:
         WorkflowTemplateRegistry with default templates.
     """
     registry = WorkflowTemplateRegistry()
 
     # Register all built-in templates
-    registry.register(create_full_development_template())
-    registry.register(create_quick_implementation_template())
-    registry.register(create_code_review_template())
-    registry.register(create_documentation_template())
-    registry.register(create_security_audit_template())
+    for template in BUILTIN_TEMPLATES.values():
+        registry.register(template)
 
     return registry
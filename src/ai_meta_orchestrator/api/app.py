@@ -7,9 +7,11 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.datastructures import Default
 from fastapi.middleware.cors import CORSMiddleware
 
 from ai_meta_orchestrator import __version__
+from ai_meta_orchestrator.api.orjson_response import ORJSONResponse
 from ai_meta_orchestrator.api.routes import (
     agents_router,
     health_router,
@@ -42,6 +44,11 @@ def create_app() -> FastAPI:
         ),
         version=__version__,
         lifespan=lifespan,
+        # Wrapped in Default() so FastAPI still treats it as the implicit
+        # response class: recent releases then keep serializing response
+        # models straight to JSON bytes via Pydantic, and orjson renders
+        # everything else.
+        default_response_class=Default(ORJSONResponse),
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
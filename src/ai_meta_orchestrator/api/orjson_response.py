@@ -0,0 +1,48 @@
+"""orjson-backed JSON response class for the REST API.
+
+orjson natively serializes the types used in API payloads (UUID, datetime,
+enums and dataclasses), so routes can hand it plain domain values without
+going through FastAPI's ``jsonable_encoder`` first.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """Serialize values that orjson does not support natively.
+
+    Args:
+        obj: The value to serialize.
+
+    Returns:
+        A JSON-compatible representation of the value.
+
+    Raises:
+        TypeError: If the value cannot be serialized.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Render content to JSON bytes.
+
+        Args:
+            content: The content to serialize.
+
+        Returns:
+            The JSON-encoded body.
+        """
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
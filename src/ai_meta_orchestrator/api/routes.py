@@ -4,23 +4,22 @@ This module provides the FastAPI router definitions for all API endpoints.
 """
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 
 from ai_meta_orchestrator import __version__
-from ai_meta_orchestrator.adapters.templates import get_default_template_registry
+from ai_meta_orchestrator.adapters.templates import BUILTIN_TEMPLATES
 from ai_meta_orchestrator.api.models import (
     AgentInfo,
     AgentListResponse,
     ErrorResponse,
     HealthResponse,
     HealthStatus,
-    PluginInfo,
     PluginListResponse,
     StandardWorkflowRequest,
     TaskListResponse,
-    TaskResponse,
     TemplateInfo,
     TemplateInstantiateRequest,
     TemplateInstantiateResponse,
@@ -31,15 +30,18 @@ from ai_meta_orchestrator.api.models import (
     WorkflowResponse,
     WorkflowResultResponse,
 )
+from ai_meta_orchestrator.api.orjson_response import ORJSONResponse
 from ai_meta_orchestrator.application.services.orchestrator_service import (
     OrchestratorService,
 )
 from ai_meta_orchestrator.domain.agents.agent_models import (
     DEFAULT_AGENT_CONFIGS,
+    AgentConfig,
     AgentRole,
 )
-from ai_meta_orchestrator.domain.plugins.plugin_models import PluginRegistry
+from ai_meta_orchestrator.domain.plugins.plugin_models import LoadedPlugin, PluginRegistry
 from ai_meta_orchestrator.domain.tasks.task_models import Task, TaskStatus
+from ai_meta_orchestrator.domain.templates.template_models import WorkflowTemplate
 from ai_meta_orchestrator.domain.workflows.workflow_models import (
     Workflow,
     WorkflowConfig,
@@ -74,6 +76,95 @@ def get_plugin_registry() -> PluginRegistry:
     return _plugin_registry
 
 
+# Read and create endpoints build plain dicts from already-validated domain
+# objects and return an ORJSONResponse directly, which skips FastAPI's
+# response-model validation and jsonable_encoder pass. The tradeoff is that
+# nothing checks these payloads against their models at runtime: the dicts
+# must stay in sync with the corresponding models in api.models, which are
+# still referenced in ``responses`` so the OpenAPI schema is unchanged.
+# Request bodies are still validated as usual.
+
+# Plain-string role values, looked up once per payload instead of going
+# through the enum on every serialization.
+_ROLE_STR: dict[AgentRole, str] = {role: role.value for role in AgentRole}
+
+
+def _agent_to_dict(role: AgentRole, config: AgentConfig) -> dict[str, Any]:
+    """Convert an agent configuration to its AgentInfo payload."""
+    return {
+        "role": _ROLE_STR[role],
+        "goal": config.goal,
+        "backstory": config.backstory,
+        "verbose": config.verbose,
+        "allow_delegation": config.allow_delegation,
+        "memory": config.memory,
+    }
+
+
+def _workflow_to_dict(workflow: Workflow) -> dict[str, Any]:
+    """Convert a workflow to its WorkflowResponse payload."""
+    completed, total = workflow.get_progress()
+    failed = sum(1 for t in workflow.tasks if t.status == TaskStatus.FAILED)
+    return {
+        "id": workflow.id,
+        "name": workflow.name,
+        "description": workflow.description,
+        "status": workflow.status,
+        "current_iteration": workflow.current_iteration,
+        "created_at": workflow.created_at,
+        "started_at": workflow.started_at,
+        "completed_at": workflow.completed_at,
+        "task_count": total,
+        "tasks_completed": completed,
+        "tasks_failed": failed,
+    }
+
+
+def _task_to_dict(task: Task) -> dict[str, Any]:
+    """Convert a task to its TaskResponse payload."""
+    return {
+        "id": task.id,
+        "name": task.name,
+        "description": task.description,
+        "assigned_to": _ROLE_STR[task.assigned_to],
+        "status": task.status,
+        "priority": task.priority,
+        "expected_output": task.expected_output,
+        "revision_count": task.revision_count,
+        "max_revisions": task.max_revisions,
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
+    }
+
+
+def _template_to_dict(template: WorkflowTemplate) -> dict[str, Any]:
+    """Convert a workflow template to its TemplateInfo payload."""
+    return {
+        "id": template.id,
+        "name": template.name,
+        "description": template.description,
+        "category": template.category,
+        "required_params": template.required_params,
+        "optional_params": template.optional_params,
+        "tags": template.tags,
+        "version": template.version,
+    }
+
+
+def _plugin_to_dict(plugin: LoadedPlugin) -> dict[str, Any]:
+    """Convert a loaded plugin to its PluginInfo payload."""
+    return {
+        "id": plugin.metadata.id,
+        "name": plugin.metadata.name,
+        "version": plugin.metadata.version,
+        "description": plugin.metadata.description,
+        "plugin_type": plugin.metadata.plugin_type.value,
+        "author": plugin.metadata.author,
+        "status": plugin.status.value,
+        "tags": plugin.metadata.tags,
+    }
+
+
 # ===== Health Router =====
 
 health_router = APIRouter(prefix="/health", tags=["Health"])
@@ -81,17 +172,20 @@ health_router = APIRouter(prefix="/health", tags=["Health"])
 
 @health_router.get(
     "",
-    response_model=HealthResponse,
     summary="Health check",
     description="Check the health status of the orchestrator service.",
+    responses={200: {"model": HealthResponse}},
 )
-def health_check() -> HealthResponse:
+def health_check() -> Response:
     """Check service health."""
-    uptime = (datetime.now() - _start_time).total_seconds()
-    return HealthResponse(
-        status=HealthStatus.HEALTHY,
-        version=__version__,
-        uptime_seconds=uptime,
+    now = datetime.now()
+    return ORJSONResponse(
+        content={
+            "status": HealthStatus.HEALTHY,
+            "version": __version__,
+            "uptime_seconds": (now - _start_time).total_seconds(),
+            "timestamp": now,
+        }
     )
 
 
@@ -102,36 +196,23 @@ agents_router = APIRouter(prefix="/agents", tags=["Agents"])
 
 @agents_router.get(
     "",
-    response_model=AgentListResponse,
     summary="List agents",
     description="Get list of all available agent roles and their configurations.",
+    responses={200: {"model": AgentListResponse}},
 )
-def list_agents() -> AgentListResponse:
+def list_agents() -> Response:
     """List all available agents."""
-    agents = []
-    for role in AgentRole:
-        config = DEFAULT_AGENT_CONFIGS[role]
-        agents.append(
-            AgentInfo(
-                role=role,
-                goal=config.goal,
-                backstory=config.backstory,
-                verbose=config.verbose,
-                allow_delegation=config.allow_delegation,
-                memory=config.memory,
-            )
-        )
-    return AgentListResponse(agents=agents, total=len(agents))
+    agents = [_agent_to_dict(role, DEFAULT_AGENT_CONFIGS[role]) for role in AgentRole]
+    return ORJSONResponse(content={"agents": agents, "total": len(agents)})
 
 
 @agents_router.get(
     "/{role}",
-    response_model=AgentInfo,
     summary="Get agent",
     description="Get details of a specific agent role.",
-    responses={404: {"model": ErrorResponse}},
+    responses={200: {"model": AgentInfo}, 404: {"model": ErrorResponse}},
 )
-def get_agent(role: AgentRole) -> AgentInfo:
+def get_agent(role: AgentRole) -> Response:
     """Get a specific agent by role."""
     config = DEFAULT_AGENT_CONFIGS.get(role)
     if config is None:
@@ -139,14 +220,7 @@ def get_agent(role: AgentRole) -> AgentInfo:
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Agent role '{role}' not found",
         )
-    return AgentInfo(
-        role=role,
-        goal=config.goal,
-        backstory=config.backstory,
-        verbose=config.verbose,
-        allow_delegation=config.allow_delegation,
-        memory=config.memory,
-    )
+    return ORJSONResponse(content=_agent_to_dict(role, config))
 
 
 # ===== Workflows Router =====
@@ -156,48 +230,24 @@ workflows_router = APIRouter(prefix="/workflows", tags=["Workflows"])
 
 @workflows_router.get(
     "",
-    response_model=WorkflowListResponse,
     summary="List workflows",
     description="Get list of all workflows.",
+    responses={200: {"model": WorkflowListResponse}},
 )
-def list_workflows() -> WorkflowListResponse:
+def list_workflows() -> Response:
     """List all workflows."""
-    workflow_responses = []
-    for wf in _workflows.values():
-        completed, total = wf.get_progress()
-        failed = sum(
-            1 for t in wf.tasks
-            if t.status == TaskStatus.FAILED
-        )
-        workflow_responses.append(
-            WorkflowResponse(
-                id=wf.id,
-                name=wf.name,
-                description=wf.description,
-                status=wf.status,
-                current_iteration=wf.current_iteration,
-                created_at=wf.created_at,
-                started_at=wf.started_at,
-                completed_at=wf.completed_at,
-                task_count=total,
-                tasks_completed=completed,
-                tasks_failed=failed,
-            )
-        )
-    return WorkflowListResponse(
-        workflows=workflow_responses,
-        total=len(workflow_responses),
-    )
+    workflows = [_workflow_to_dict(wf) for wf in _workflows.values()]
+    return ORJSONResponse(content={"workflows": workflows, "total": len(workflows)})
 
 
 @workflows_router.post(
     "",
-    response_model=WorkflowResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create workflow",
     description="Create a new workflow with tasks.",
+    responses={201: {"model": WorkflowResponse}},
 )
-def create_workflow(workflow_data: WorkflowCreate) -> WorkflowResponse:
+def create_workflow(workflow_data: WorkflowCreate) -> Response:
     """Create a new workflow."""
     config = WorkflowConfig(
         mode=workflow_data.config.mode,
@@ -227,27 +277,19 @@ def create_workflow(workflow_data: WorkflowCreate) -> WorkflowResponse:
 
     _workflows[workflow.id] = workflow
 
-    return WorkflowResponse(
-        id=workflow.id,
-        name=workflow.name,
-        description=workflow.description,
-        status=workflow.status,
-        current_iteration=workflow.current_iteration,
-        created_at=workflow.created_at,
-        started_at=workflow.started_at,
-        completed_at=workflow.completed_at,
-        task_count=len(workflow.tasks),
+    return ORJSONResponse(
+        content=_workflow_to_dict(workflow),
+        status_code=status.HTTP_201_CREATED,
     )
 
 
 @workflows_router.get(
     "/{workflow_id}",
-    response_model=WorkflowResponse,
     summary="Get workflow",
     description="Get details of a specific workflow.",
-    responses={404: {"model": ErrorResponse}},
+    responses={200: {"model": WorkflowResponse}, 404: {"model": ErrorResponse}},
 )
-def get_workflow(workflow_id: UUID) -> WorkflowResponse:
+def get_workflow(workflow_id: UUID) -> Response:
     """Get a specific workflow."""
     workflow = _workflows.get(workflow_id)
     if workflow is None:
@@ -256,25 +298,7 @@ def get_workflow(workflow_id: UUID) -> WorkflowResponse:
             detail=f"Workflow '{workflow_id}' not found",
         )
 
-    completed, total = workflow.get_progress()
-    failed = sum(
-        1 for t in workflow.tasks
-        if t.status == TaskStatus.FAILED
-    )
-
-    return WorkflowResponse(
-        id=workflow.id,
-        name=workflow.name,
-        description=workflow.description,
-        status=workflow.status,
-        current_iteration=workflow.current_iteration,
-        created_at=workflow.created_at,
-        started_at=workflow.started_at,
-        completed_at=workflow.completed_at,
-        task_count=total,
-        tasks_completed=completed,
-        tasks_failed=failed,
-    )
+    return ORJSONResponse(content=_workflow_to_dict(workflow))
 
 
 @workflows_router.post(
@@ -319,12 +343,11 @@ def run_workflow(workflow_id: UUID) -> WorkflowResultResponse:
 
 @workflows_router.get(
     "/{workflow_id}/tasks",
-    response_model=TaskListResponse,
     summary="Get workflow tasks",
     description="Get all tasks in a workflow.",
-    responses={404: {"model": ErrorResponse}},
+    responses={200: {"model": TaskListResponse}, 404: {"model": ErrorResponse}},
 )
-def get_workflow_tasks(workflow_id: UUID) -> TaskListResponse:
+def get_workflow_tasks(workflow_id: UUID) -> Response:
     """Get tasks in a workflow."""
     workflow = _workflows.get(workflow_id)
     if workflow is None:
@@ -333,34 +356,17 @@ def get_workflow_tasks(workflow_id: UUID) -> TaskListResponse:
             detail=f"Workflow '{workflow_id}' not found",
         )
 
-    tasks = [
-        TaskResponse(
-            id=task.id,
-            name=task.name,
-            description=task.description,
-            assigned_to=task.assigned_to,
-            status=task.status,
-            priority=task.priority,
-            expected_output=task.expected_output,
-            revision_count=task.revision_count,
-            max_revisions=task.max_revisions,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
-        for task in workflow.tasks
-    ]
-
-    return TaskListResponse(tasks=tasks, total=len(tasks))
+    tasks = [_task_to_dict(task) for task in workflow.tasks]
+    return ORJSONResponse(content={"tasks": tasks, "total": len(tasks)})
 
 
 @workflows_router.get(
     "/{workflow_id}/result",
-    response_model=WorkflowResultResponse,
     summary="Get workflow result",
     description="Get the execution result of a workflow.",
-    responses={404: {"model": ErrorResponse}},
+    responses={200: {"model": WorkflowResultResponse}, 404: {"model": ErrorResponse}},
 )
-def get_workflow_result(workflow_id: UUID) -> WorkflowResultResponse:
+def get_workflow_result(workflow_id: UUID) -> Response:
     """Get workflow execution result."""
     result = _workflow_results.get(workflow_id)
     if result is None:
@@ -368,7 +374,7 @@ def get_workflow_result(workflow_id: UUID) -> WorkflowResultResponse:
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No result found for workflow '{workflow_id}'",
         )
-    return result
+    return ORJSONResponse(content=result.model_dump(mode="json"))
 
 
 @workflows_router.post(
@@ -430,7 +436,7 @@ def pause_workflow(workflow_id: UUID) -> WorkflowActionResponse:
     else:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot pause workflow in state '{workflow.status.value}'",
+            detail=f"Cannot pause workflow in state '{workflow.status}'",
         )
 
 
@@ -461,7 +467,7 @@ def resume_workflow(workflow_id: UUID) -> WorkflowActionResponse:
     else:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot resume workflow in state '{workflow.status.value}'",
+            detail=f"Cannot resume workflow in state '{workflow.status}'",
         )
 
 
@@ -488,46 +494,38 @@ def delete_workflow(workflow_id: UUID) -> None:
 
 templates_router = APIRouter(prefix="/templates", tags=["Templates"])
 
+# The built-in templates never change at runtime, so the list payload is
+# rendered once and served as-is.
+_TEMPLATE_LIST_BODY = bytes(
+    ORJSONResponse(
+        content={
+            "templates": [_template_to_dict(t) for t in BUILTIN_TEMPLATES.values()],
+            "total": len(BUILTIN_TEMPLATES),
+        }
+    ).body
+)
+
 
 @templates_router.get(
     "",
-    response_model=TemplateListResponse,
     summary="List templates",
     description="Get list of all available workflow templates.",
+    responses={200: {"model": TemplateListResponse}},
 )
-def list_templates() -> TemplateListResponse:
+def list_templates() -> Response:
     """List all workflow templates."""
-    registry = get_default_template_registry()
-    templates = registry.list_all()
-
-    template_infos = [
-        TemplateInfo(
-            id=t.id,
-            name=t.name,
-            description=t.description,
-            category=t.category,
-            required_params=t.required_params,
-            optional_params=t.optional_params,
-            tags=t.tags,
-            version=t.version,
-        )
-        for t in templates
-    ]
-
-    return TemplateListResponse(templates=template_infos, total=len(template_infos))
+    return Response(content=_TEMPLATE_LIST_BODY, media_type="application/json")
 
 
 @templates_router.get(
     "/{template_name}",
-    response_model=TemplateInfo,
     summary="Get template",
     description="Get details of a specific workflow template.",
-    responses={404: {"model": ErrorResponse}},
+    responses={200: {"model": TemplateInfo}, 404: {"model": ErrorResponse}},
 )
-def get_template(template_name: str) -> TemplateInfo:
+def get_template(template_name: str) -> Response:
     """Get a specific template by name."""
-    registry = get_default_template_registry()
-    template = registry.get(template_name)
+    template = BUILTIN_TEMPLATES.get(template_name)
 
     if template is None:
         raise HTTPException(
@@ -535,31 +533,24 @@ def get_template(template_name: str) -> TemplateInfo:
             detail=f"Template '{template_name}' not found",
         )
 
-    return TemplateInfo(
-        id=template.id,
-        name=template.name,
-        description=template.description,
-        category=template.category,
-        required_params=template.required_params,
-        optional_params=template.optional_params,
-        tags=template.tags,
-        version=template.version,
-    )
+    return ORJSONResponse(content=_template_to_dict(template))
 
 
 @templates_router.post(
     "/instantiate",
-    response_model=TemplateInstantiateResponse,
     summary="Instantiate template",
     description="Create a workflow from a template with the given parameters.",
-    responses={404: {"model": ErrorResponse}, 400: {"model": ErrorResponse}},
+    responses={
+        200: {"model": TemplateInstantiateResponse},
+        404: {"model": ErrorResponse},
+        400: {"model": ErrorResponse},
+    },
 )
 def instantiate_template(
     request: TemplateInstantiateRequest,
-) -> TemplateInstantiateResponse:
+) -> Response:
     """Instantiate a workflow from a template."""
-    registry = get_default_template_registry()
-    template = registry.get(request.template_name)
+    template = BUILTIN_TEMPLATES.get(request.template_name)
 
     if template is None:
         raise HTTPException(
@@ -595,11 +586,13 @@ def instantiate_template(
             outputs=result.outputs,
         )
 
-    return TemplateInstantiateResponse(
-        workflow_id=workflow.id,
-        workflow_name=workflow.name,
-        task_count=len(workflow.tasks),
-        status=workflow.status,
+    return ORJSONResponse(
+        content={
+            "workflow_id": workflow.id,
+            "workflow_name": workflow.name,
+            "task_count": len(workflow.tasks),
+            "status": workflow.status,
+        }
     )
 
 
@@ -610,31 +603,18 @@ plugins_router = APIRouter(prefix="/plugins", tags=["Plugins"])
 
 @plugins_router.get(
     "",
-    response_model=PluginListResponse,
     summary="List plugins",
     description="Get list of all registered plugins.",
+    responses={200: {"model": PluginListResponse}},
 )
-def list_plugins() -> PluginListResponse:
+def list_plugins() -> Response:
     """List all plugins."""
     registry = get_plugin_registry()
-    plugins = registry.list_all()
-
-    plugin_infos = [
-        PluginInfo(
-            id=p.metadata.id,
-            name=p.metadata.name,
-            version=p.metadata.version,
-            description=p.metadata.description,
-            plugin_type=p.metadata.plugin_type.value,
-            author=p.metadata.author,
-            status=p.status.value,
-            tags=p.metadata.tags,
-        )
-        for p in plugins
-    ]
-
-    return PluginListResponse(
-        plugins=plugin_infos,
-        total=len(plugin_infos),
-        active_count=registry.get_active_count(),
+    plugins = [_plugin_to_dict(p) for p in registry.list_all()]
+    return ORJSONResponse(
+        content={
+            "plugins": plugins,
+            "total": len(plugins),
+            "active_count": registry.get_active_count(),
+        }
     )
@@ -1,6 +1,7 @@
 """Orchestrator service - Main service for coordinating agents and workflows."""
 
-from typing import Any
+from collections import deque
+from uuid import UUID
 
 from crewai import Crew, Process
 
@@ -273,7 +274,7 @@ class OrchestratorService:
         """
         span_id = self._observability.start_span(f"workflow_{workflow.id}")
         import time
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             workflow.start()
@@ -282,10 +283,8 @@ class OrchestratorService:
             required_roles = {task.assigned_to for task in workflow.tasks}
             self.initialize_agents(list(required_roles))
 
-            outputs: dict[str, Any] = {}
-            errors: list[str] = []
-            tasks_completed = 0
-            tasks_failed = 0
+            # Counters are accumulated live as tasks finish
+            workflow_result = WorkflowResult(success=False)
 
             if workflow.config.mode == WorkflowMode.SEQUENTIAL:
                 # Sequential execution
@@ -307,20 +306,18 @@ class OrchestratorService:
                         )
 
                     if result.success:
-                        tasks_completed += 1
-                        outputs[str(task.id)] = result.output
+                        workflow_result.increment_completed()
+                        workflow_result.outputs[str(task.id)] = result.output
                     else:
-                        tasks_failed += 1
+                        workflow_result.increment_failed()
                         if result.error:
-                            errors.append(f"Task {task.name}: {result.error}")
+                            workflow_result.errors.append(f"Task {task.name}: {result.error}")
 
                     workflow.increment_iteration()
 
             elif workflow.config.mode == WorkflowMode.PARALLEL:
                 # Parallel execution with dependency resolution
-                tasks_completed, tasks_failed, outputs, errors = (
-                    self._run_parallel_workflow(workflow)
-                )
+                self._run_parallel_workflow(workflow, workflow_result)
 
             else:
                 # For HIERARCHICAL mode, use CrewAI's Crew
@@ -354,27 +351,20 @@ class OrchestratorService:
 
                 try:
                     crew_result = crew.kickoff()
-                    tasks_completed = len(workflow.tasks)
-                    outputs["crew_result"] = str(crew_result)
+                    workflow_result.tasks_completed = len(workflow.tasks)
+                    workflow_result.outputs["crew_result"] = str(crew_result)
                 except Exception as e:
-                    tasks_failed = len(workflow.tasks)
-                    errors.append(str(e))
+                    workflow_result.tasks_failed = len(workflow.tasks)
+                    workflow_result.errors.append(str(e))
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
+            workflow_result.total_iterations = workflow.current_iteration
+            workflow_result.duration_seconds = duration
 
             # Only complete if not paused
             if workflow.status != WorkflowStatus.PAUSED:
-                success = tasks_failed == 0
-
-                workflow_result = WorkflowResult(
-                    success=success,
-                    tasks_completed=tasks_completed,
-                    tasks_failed=tasks_failed,
-                    total_iterations=workflow.current_iteration,
-                    outputs=outputs,
-                    errors=errors,
-                    duration_seconds=duration,
-                )
+                success = workflow_result.tasks_failed == 0
+                workflow_result.success = success
 
                 workflow.complete(workflow_result)
                 self._observability.log_event(
@@ -382,31 +372,24 @@ class OrchestratorService:
                     {
                         "workflow_id": str(workflow.id),
                         "success": success,
-                        "tasks_completed": tasks_completed,
-                        "tasks_failed": tasks_failed,
+                        "tasks_completed": workflow_result.tasks_completed,
+                        "tasks_failed": workflow_result.tasks_failed,
                         "duration": duration,
                     },
                 )
-
-                return workflow_result
             else:
                 # Return partial result for paused workflows
-                return WorkflowResult(
-                    success=False,
-                    tasks_completed=tasks_completed,
-                    tasks_failed=tasks_failed,
-                    total_iterations=workflow.current_iteration,
-                    outputs=outputs,
-                    errors=["Workflow paused"],
-                    duration_seconds=duration,
-                )
+                workflow_result.errors = ["Workflow paused"]
+
+            return workflow_result
         finally:
             self._observability.end_span(span_id)
 
     def _run_parallel_workflow(
         self,
         workflow: Workflow,
-    ) -> tuple[int, int, dict[str, Any], list[str]]:
+        workflow_result: WorkflowResult,
+    ) -> None:
         """Run workflow tasks in parallel where dependencies allow.
 
         This method executes tasks that have no dependencies or whose
@@ -414,18 +397,14 @@ class OrchestratorService:
 
         Args:
             workflow: The workflow to run.
-
-        Returns:
-            Tuple of (tasks_completed, tasks_failed, outputs, errors).
+            workflow_result: Result that task outcomes are accumulated into.
         """
         import concurrent.futures
         import threading
 
-        outputs: dict[str, Any] = {}
-        errors: list[str] = []
-        tasks_completed = 0
-        tasks_failed = 0
+        errors = workflow_result.errors
         lock = threading.Lock()
+        finished_statuses = (TaskStatus.COMPLETED, TaskStatus.FAILED)
 
         def execute_single_task(task: Task) -> TaskResult:
             """Execute a single task and return the result."""
@@ -436,41 +415,48 @@ class OrchestratorService:
                 with_evaluation=workflow.config.enable_evaluation,
             )
 
-        # Continue until all tasks are processed or workflow is paused
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            while not workflow.is_complete():
-                # Check for pause
-                if workflow.status == WorkflowStatus.PAUSED:
-                    break
+        # Count each pending task's unfinished dependencies once, then release
+        # dependents as tasks finish instead of rescanning the whole workflow
+        # after every batch. Dependencies that never finish (unknown IDs or
+        # tasks left in another state) keep their dependents blocked.
+        finished = {t.id for t in workflow.tasks if t.status in finished_statuses}
+        remaining: dict[UUID, int] = {}
+        dependents: dict[UUID, list[Task]] = {}
+        ready: deque[Task] = deque()
+        for task in workflow.tasks:
+            if task.status != TaskStatus.PENDING:
+                continue
+            deps = set(task.context_tasks) - finished
+            remaining[task.id] = len(deps)
+            for dep_id in deps:
+                dependents.setdefault(dep_id, []).append(task)
+            if not deps:
+                ready.append(task)
 
-                # Get tasks ready to execute
-                ready_tasks = workflow.get_ready_tasks()
-                if not ready_tasks:
-                    # No tasks ready but not complete - may have circular deps
-                    pending = workflow.get_pending_tasks()
-                    if pending:
-                        errors.append(
-                            "Workflow has unresolvable dependencies or no ready tasks"
-                        )
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            in_flight: dict[concurrent.futures.Future[TaskResult], Task] = {}
+            while True:
+                # Stop dispatching once paused; in-flight tasks still finish
+                if workflow.status != WorkflowStatus.PAUSED:
+                    while ready:
+                        task = ready.popleft()
+                        in_flight[executor.submit(execute_single_task, task)] = task
+                if not in_flight:
                     break
 
-                # Submit ready tasks for parallel execution
-                futures = {
-                    executor.submit(execute_single_task, task): task
-                    for task in ready_tasks
-                }
-
-                # Process completed futures
-                for future in concurrent.futures.as_completed(futures):
-                    task = futures[future]
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    task = in_flight.pop(future)
                     try:
                         result = future.result()
                         with lock:
                             if result.success:
-                                tasks_completed += 1
-                                outputs[str(task.id)] = result.output
+                                workflow_result.increment_completed()
+                                workflow_result.outputs[str(task.id)] = result.output
                             else:
-                                tasks_failed += 1
+                                workflow_result.increment_failed()
                                 if result.error:
                                     errors.append(f"Task {task.name}: {result.error}")
                             workflow.increment_iteration()
@@ -478,10 +464,21 @@ class OrchestratorService:
                         with lock:
                             # Update task status on exception
                             task.status = TaskStatus.FAILED
-                            tasks_failed += 1
+                            workflow_result.increment_failed()
                             errors.append(f"Task {task.name} raised exception: {e}")
 
-        return tasks_completed, tasks_failed, outputs, errors
+                    if task.status in finished_statuses:
+                        for dependent in dependents.pop(task.id, ()):
+                            remaining[dependent.id] -= 1
+                            if remaining[dependent.id] == 0:
+                                ready.append(dependent)
+                    elif task.status == TaskStatus.PENDING:
+                        # Correction loop ran out of attempts; try it again
+                        ready.append(task)
+
+        if workflow.status != WorkflowStatus.PAUSED and workflow.get_pending_tasks():
+            # Pending tasks whose dependencies can never finish, e.g. cycles
+            errors.append("Workflow has unresolvable dependencies or no ready tasks")
 
     def create_standard_workflow(
         self,
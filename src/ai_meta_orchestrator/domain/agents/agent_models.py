@@ -1,11 +1,12 @@
 """Agent role definitions and domain models."""
 
 from dataclasses import dataclass, field
-from enum import Enum
 from typing import Any
 
+from ai_meta_orchestrator._compat import StrEnum
 
-class AgentRole(str, Enum):
+
+class AgentRole(StrEnum):
     """Enumeration of available agent roles in the orchestrator."""
 
     PM = "project_manager"
@@ -8,15 +8,15 @@ import contextlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import Any
+from typing import Any, cast
 from uuid import UUID, uuid4
 
+from ai_meta_orchestrator._compat import StrEnum
 from ai_meta_orchestrator.domain.agents.agent_models import AgentConfig
 from ai_meta_orchestrator.domain.tasks.task_models import Task, TaskResult
 
 
-class PluginType(str, Enum):
+class PluginType(StrEnum):
     """Types of plugins supported."""
 
     AGENT = "agent"
@@ -26,7 +26,7 @@ class PluginType(str, Enum):
     ADAPTER = "adapter"
 
 
-class PluginStatus(str, Enum):
+class PluginStatus(StrEnum):
     """Status of a loaded plugin."""
 
     ACTIVE = "active"
@@ -35,7 +35,7 @@ class PluginStatus(str, Enum):
     LOADING = "loading"
 
 
-class HookPoint(str, Enum):
+class HookPoint(StrEnum):
     """Available hook points in the orchestrator lifecycle."""
 
     BEFORE_WORKFLOW_START = "before_workflow_start"
@@ -47,7 +47,7 @@ class HookPoint(str, Enum):
     ON_REVISION_REQUEST = "on_revision_request"
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginMetadata:
     """Metadata describing a plugin.
 
@@ -196,7 +196,7 @@ class HookPlugin(PluginInterface):
 
     @property
     @abstractmethod
-    def hook_points(self) -> list[HookPoint]:
+    def hook_points(self) -> frozenset[HookPoint]:
         """Get the hook points this plugin handles.
 
         Returns:
@@ -243,6 +243,15 @@ class LoadedPlugin:
     error_message: str | None = None
 
 
+# Interface a plugin of each type must implement to be returned by the
+# typed registry accessors (``get_agent_plugins``, ``get_tool_plugins``).
+_TYPE_INTERFACES: dict[PluginType, type] = {
+    PluginType.AGENT: AgentPlugin,
+    PluginType.TOOL: ToolPlugin,
+    PluginType.HOOK: HookPlugin,
+}
+
+
 class PluginRegistry:
     """Registry for managing loaded plugins.
 
@@ -253,8 +262,15 @@ class PluginRegistry:
     def __init__(self) -> None:
         """Initialize the plugin registry."""
         self._plugins: dict[str, LoadedPlugin] = {}
-        self._by_type: dict[PluginType, list[str]] = {pt: [] for pt in PluginType}
-        self._hooks: dict[HookPoint, list[str]] = {hp: [] for hp in HookPoint}
+        self._by_type: dict[PluginType, list[LoadedPlugin]] = {
+            pt: [] for pt in PluginType
+        }
+        self._by_interface: dict[type, list[LoadedPlugin]] = {
+            iface: [] for iface in _TYPE_INTERFACES.values()
+        }
+        self._hooks: dict[HookPoint, list[LoadedPlugin]] = {
+            hp: [] for hp in HookPoint
+        }
 
     def register(
         self,
@@ -286,12 +302,15 @@ class PluginRegistry:
             if plugin.initialize(config or {}):
                 loaded.status = PluginStatus.ACTIVE
                 self._plugins[name] = loaded
-                self._by_type[metadata.plugin_type].append(name)
+                self._by_type[metadata.plugin_type].append(loaded)
+                interface = _TYPE_INTERFACES.get(metadata.plugin_type)
+                if interface is not None and isinstance(plugin, interface):
+                    self._by_interface[interface].append(loaded)
 
                 # Register hooks if it's a hook plugin
                 if isinstance(plugin, HookPlugin):
                     for hook_point in plugin.hook_points:
-                        self._hooks[hook_point].append(name)
+                        self._hooks[hook_point].append(loaded)
 
                 return True
             else:
@@ -324,15 +343,18 @@ class PluginRegistry:
         with contextlib.suppress(Exception):
             plugin.shutdown()
 
-        # Remove from type index
-        if name in self._by_type[metadata.plugin_type]:
-            self._by_type[metadata.plugin_type].remove(name)
+        # Remove from type and interface indexes
+        if loaded in self._by_type[metadata.plugin_type]:
+            self._by_type[metadata.plugin_type].remove(loaded)
+        interface = _TYPE_INTERFACES.get(metadata.plugin_type)
+        if interface is not None and loaded in self._by_interface[interface]:
+            self._by_interface[interface].remove(loaded)
 
         # Remove from hooks
         if isinstance(plugin, HookPlugin):
             for hook_point in plugin.hook_points:
-                if name in self._hooks[hook_point]:
-                    self._hooks[hook_point].remove(name)
+                if loaded in self._hooks[hook_point]:
+                    self._hooks[hook_point].remove(loaded)
 
         del self._plugins[name]
         return True
@@ -357,7 +379,7 @@ class PluginRegistry:
         Returns:
             List of loaded plugins.
         """
-        return [self._plugins[name] for name in self._by_type.get(plugin_type, [])]
+        return list(self._by_type[plugin_type])
 
     def get_agent_plugins(self) -> list[AgentPlugin]:
         """Get all active agent plugins.
@@ -365,14 +387,11 @@ class PluginRegistry:
         Returns:
             List of AgentPlugin instances.
         """
-        plugins = []
-        for loaded in self.get_by_type(PluginType.AGENT):
-            if (
-                loaded.status == PluginStatus.ACTIVE
-                and isinstance(loaded.plugin, AgentPlugin)
-            ):
-                plugins.append(loaded.plugin)
-        return plugins
+        return [
+            cast(AgentPlugin, loaded.plugin)
+            for loaded in self._by_interface[AgentPlugin]
+            if loaded.status == PluginStatus.ACTIVE
+        ]
 
     def get_tool_plugins(self) -> list[ToolPlugin]:
         """Get all active tool plugins.
@@ -380,14 +399,11 @@ class PluginRegistry:
         Returns:
             List of ToolPlugin instances.
         """
-        plugins = []
-        for loaded in self.get_by_type(PluginType.TOOL):
-            if (
-                loaded.status == PluginStatus.ACTIVE
-                and isinstance(loaded.plugin, ToolPlugin)
-            ):
-                plugins.append(loaded.plugin)
-        return plugins
+        return [
+            cast(ToolPlugin, loaded.plugin)
+            for loaded in self._by_interface[ToolPlugin]
+            if loaded.status == PluginStatus.ACTIVE
+        ]
 
     def trigger_hook(
         self,
@@ -403,13 +419,11 @@ class PluginRegistry:
         Returns:
             Modified context after all handlers.
         """
-        for name in self._hooks.get(hook_point, []):
-            loaded = self._plugins.get(name)
-            if loaded and loaded.status == PluginStatus.ACTIVE:
-                plugin = loaded.plugin
-                if isinstance(plugin, HookPlugin):
-                    with contextlib.suppress(Exception):
-                        context = plugin.on_hook(hook_point, context)
+        for loaded in self._hooks.get(hook_point, ()):
+            if loaded.status == PluginStatus.ACTIVE:
+                plugin = cast(HookPlugin, loaded.plugin)
+                with contextlib.suppress(Exception):
+                    context = plugin.on_hook(hook_point, context)
         return context
 
     def list_all(self) -> list[LoadedPlugin]:
@@ -2,14 +2,14 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
 
+from ai_meta_orchestrator._compat import StrEnum
 from ai_meta_orchestrator.domain.agents.agent_models import AgentRole
 
 
-class TaskStatus(str, Enum):
+class TaskStatus(StrEnum):
     """Status of a task in the workflow."""
 
     PENDING = "pending"
@@ -20,7 +20,7 @@ class TaskStatus(str, Enum):
     BLOCKED = "blocked"
 
 
-class TaskPriority(str, Enum):
+class TaskPriority(StrEnum):
     """Priority level of a task."""
 
     LOW = "low"
@@ -29,7 +29,14 @@ class TaskPriority(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Status a task moves to when completed, keyed on TaskResult.success.
+_COMPLETE_MAP: dict[bool, TaskStatus] = {
+    True: TaskStatus.COMPLETED,
+    False: TaskStatus.FAILED,
+}
+
+
+@dataclass(slots=True)
 class TaskResult:
     """Result of a task execution.
 
@@ -48,7 +55,7 @@ class TaskResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Result of evaluating a task's output.
 
@@ -67,7 +74,7 @@ class EvaluationResult:
     suggestions: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a task in the orchestrator workflow.
 
@@ -113,7 +120,7 @@ class Task:
     def complete(self, result: TaskResult) -> None:
         """Mark the task as completed with the given result."""
         self.result = result
-        self.status = TaskStatus.COMPLETED if result.success else TaskStatus.FAILED
+        self.status = _COMPLETE_MAP[bool(result.success)]
         self.updated_at = datetime.now()
 
     def request_revision(self, evaluation: EvaluationResult) -> bool:
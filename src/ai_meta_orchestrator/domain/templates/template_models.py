@@ -5,10 +5,10 @@ that can be instantiated with specific parameters.
 """
 
 from dataclasses import dataclass, field
-from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
 
+from ai_meta_orchestrator._compat import StrEnum
 from ai_meta_orchestrator.domain.agents.agent_models import AgentRole
 from ai_meta_orchestrator.domain.tasks.task_models import Task, TaskPriority
 from ai_meta_orchestrator.domain.workflows.workflow_models import (
@@ -18,7 +18,7 @@ from ai_meta_orchestrator.domain.workflows.workflow_models import (
 )
 
 
-class TemplateCategory(str, Enum):
+class TemplateCategory(StrEnum):
     """Categories for workflow templates."""
 
     DEVELOPMENT = "development"
@@ -50,7 +50,7 @@ class WorkflowTemplateConfig:
     parameters: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskTemplate:
     """Template for a task that can be instantiated.
 
@@ -84,16 +84,16 @@ class TaskTemplate:
             A Task instance with substituted values.
         """
         return Task(
-            name=self.name_template.format(**params),
-            description=self.description_template.format(**params),
+            name=self.name_template.format_map(params),
+            description=self.description_template.format_map(params),
             assigned_to=self.assigned_to,
-            expected_output=self.expected_output_template.format(**params),
+            expected_output=self.expected_output_template.format_map(params),
             priority=self.priority,
             metadata={"template_id": str(self.id), **self.metadata},
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowTemplate:
     """A reusable workflow template.
 
@@ -134,13 +134,9 @@ class WorkflowTemplate:
             params: Dictionary of parameter values.
 
         Returns:
-            List of missing required parameter names.
+            List of missing required parameter names, in declaration order.
         """
-        missing = []
-        for param in self.required_params:
-            if param not in params:
-                missing.append(param)
-        return missing
+        return [param for param in self.required_params if param not in params]
 
     def instantiate(
         self,
@@ -169,8 +165,8 @@ class WorkflowTemplate:
 
         # Create workflow with configuration
         workflow = Workflow(
-            name=workflow_name or self.name.format(**all_params),
-            description=self.description.format(**all_params),
+            name=workflow_name or self.name.format_map(all_params),
+            description=self.description.format_map(all_params),
             config=WorkflowConfig(
                 mode=self.config.mode,
                 max_iterations=self.config.max_iterations,
@@ -216,10 +212,21 @@ class WorkflowTemplateRegistry:
         self._by_category: dict[TemplateCategory, list[str]] = {
             cat: [] for cat in TemplateCategory
         }
+        self._by_tag: dict[str, list[str]] = {}
+        # Tags each template had when registered, so unregister removes
+        # exactly the index entries register added.
+        self._tags: dict[str, tuple[str, ...]] = {}
+        # Registration sequence number per template, used to return tag
+        # search results in registration order.
+        self._order: dict[str, int] = {}
+        self._next_order = 0
 
     def register(self, template: WorkflowTemplate) -> None:
         """Register a workflow template.
 
+        The template's tags are indexed as they are at registration time;
+        re-register the template to pick up later tag changes.
+
         Args:
             template: The template to register.
 
@@ -231,6 +238,12 @@ class WorkflowTemplateRegistry:
 
         self._templates[template.name] = template
         self._by_category[template.category].append(template.name)
+        tags = tuple(dict.fromkeys(template.tags))
+        self._tags[template.name] = tags
+        for tag in tags:
+            self._by_tag.setdefault(tag, []).append(template.name)
+        self._order[template.name] = self._next_order
+        self._next_order += 1
 
     def get(self, name: str) -> WorkflowTemplate | None:
         """Get a template by name.
@@ -261,13 +274,14 @@ class WorkflowTemplateRegistry:
             tags: List of tags to search for.
 
         Returns:
-            List of templates matching any of the tags.
+            List of templates matching any of the tags, in registration order.
         """
-        matching = []
-        for template in self._templates.values():
-            if any(tag in template.tags for tag in tags):
-                matching.append(template)
-        return matching
+        names = {
+            name for tag in set(tags) for name in self._by_tag.get(tag, ())
+        }
+        return [
+            self._templates[name] for name in sorted(names, key=self._order.__getitem__)
+        ]
 
     def list_all(self) -> list[WorkflowTemplate]:
         """Get all registered templates.
@@ -289,5 +303,11 @@ class WorkflowTemplateRegistry:
         if name in self._templates:
             template = self._templates.pop(name)
             self._by_category[template.category].remove(name)
+            for tag in self._tags.pop(name):
+                bucket = self._by_tag[tag]
+                bucket.remove(name)
+                if not bucket:
+                    del self._by_tag[tag]
+            del self._order[name]
             return True
         return False
@@ -1,15 +1,19 @@
 """Workflow domain models and orchestration logic."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
 
+from ai_meta_orchestrator._compat import StrEnum
 from ai_meta_orchestrator.domain.tasks.task_models import Task, TaskStatus
 
+# Task statuses that count as finished for progress and dependency tracking
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED})
 
-class WorkflowStatus(str, Enum):
+
+class WorkflowStatus(StrEnum):
     """Status of a workflow."""
 
     NOT_STARTED = "not_started"
@@ -19,7 +23,7 @@ class WorkflowStatus(str, Enum):
     FAILED = "failed"
 
 
-class WorkflowMode(str, Enum):
+class WorkflowMode(StrEnum):
     """Execution mode for the workflow."""
 
     SEQUENTIAL = "sequential"
@@ -27,7 +31,20 @@ class WorkflowMode(str, Enum):
     HIERARCHICAL = "hierarchical"
 
 
-@dataclass
+# Status a workflow moves to when completed, keyed on WorkflowResult.success.
+_COMPLETE_MAP: dict[bool, WorkflowStatus] = {
+    True: WorkflowStatus.COMPLETED,
+    False: WorkflowStatus.FAILED,
+}
+
+# Statuses a workflow must be in for each guarded transition.
+_ALLOWED_TRANSITIONS: dict[str, frozenset[WorkflowStatus]] = {
+    "pause": frozenset({WorkflowStatus.RUNNING}),
+    "resume": frozenset({WorkflowStatus.PAUSED}),
+}
+
+
+@dataclass(slots=True)
 class WorkflowConfig:
     """Configuration for workflow execution.
 
@@ -48,7 +65,7 @@ class WorkflowConfig:
     memory: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowResult:
     """Result of a workflow execution.
 
@@ -70,9 +87,44 @@ class WorkflowResult:
     errors: list[str] = field(default_factory=list)
     duration_seconds: float = 0.0
 
+    def increment_completed(self) -> None:
+        """Record a task that completed successfully."""
+        self.tasks_completed += 1
+
+    def increment_failed(self) -> None:
+        """Record a task that failed."""
+        self.tasks_failed += 1
+
+
+class _TaskIndex:
+    """Task ID -> position index kept outside Workflow's dataclass fields.
+
+    Keeping the index out of the fields keeps it out of ``dataclasses.asdict``,
+    equality, repr and serialized output.
+    """
+
+    __slots__ = ("_task_positions", "_indexed_count")
+
+    _task_positions: dict[UUID, int]
+    _indexed_count: int
+
+    def _reindex_tasks(self, tasks: list[Task]) -> None:
+        """Rebuild the index from a task list, keeping the first of any duplicates."""
+        positions: dict[UUID, int] = {}
+        for position, task in enumerate(tasks):
+            positions.setdefault(task.id, position)
+        self._task_positions = positions
+        self._indexed_count = len(tasks)
+
+    def _index_appended_task(self, tasks: list[Task]) -> None:
+        """Index the last task in a list the index was in step with before it."""
+        if self._indexed_count == len(tasks) - 1:
+            self._task_positions.setdefault(tasks[-1].id, self._indexed_count)
+            self._indexed_count += 1
+
 
-@dataclass
-class Workflow:
+@dataclass(slots=True)
+class Workflow(_TaskIndex):
     """Represents a workflow containing multiple tasks.
 
     Attributes:
@@ -103,46 +155,65 @@ class Workflow:
     completed_at: datetime | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        """Index the tasks passed to the constructor by ID."""
+        self._reindex_tasks(self.tasks)
+
     def add_task(self, task: Task) -> None:
         """Add a task to the workflow."""
         self.tasks.append(task)
+        self._index_appended_task(self.tasks)
 
     def get_task_by_id(self, task_id: UUID) -> Task | None:
         """Get a task by its ID."""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        tasks = self.tasks
+        position = self._task_positions.get(task_id)
+        # ``tasks`` may have been edited or replaced directly. The index is
+        # stale if its length no longer matches or a stored position points
+        # at a different task; an ID that is simply absent is not a reason
+        # to rebuild.
+        if len(tasks) != self._indexed_count or (
+            position is not None
+            and (position >= len(tasks) or tasks[position].id != task_id)
+        ):
+            self._reindex_tasks(tasks)
+            position = self._task_positions.get(task_id)
+        return None if position is None else tasks[position]
 
     def get_pending_tasks(self) -> list[Task]:
         """Get all pending tasks."""
         return [t for t in self.tasks if t.status == TaskStatus.PENDING]
 
-    def get_ready_tasks(self) -> list[Task]:
-        """Get tasks ready for execution (dependencies completed).
+    def iter_ready_tasks(self) -> Iterator[Task]:
+        """Iterate over tasks ready for execution (dependencies completed).
 
-        Returns tasks that are pending and have all their context_tasks completed.
-        This is useful for parallel execution modes.
+        Tasks are yielded lazily in workflow order, so callers that only need
+        the next ready task can stop early instead of scanning every task.
+        Finished tasks are collected once when iteration starts.
 
-        Returns:
-            List of tasks ready to be executed.
+        Yields:
+            Pending tasks whose context_tasks have all completed or failed.
         """
-        completed_task_ids = {
-            t.id for t in self.tasks
-            if t.status in (TaskStatus.COMPLETED, TaskStatus.FAILED)
-        }
+        completed_task_ids = {t.id for t in self.tasks if t.status in _TERMINAL_STATUSES}
 
-        ready = []
         for task in self.tasks:
             if task.status != TaskStatus.PENDING:
                 continue
 
             # Check if all dependencies are completed
-            deps_met = all(dep_id in completed_task_ids for dep_id in task.context_tasks)
-            if deps_met:
-                ready.append(task)
+            if all(dep_id in completed_task_ids for dep_id in task.context_tasks):
+                yield task
+
+    def get_ready_tasks(self) -> list[Task]:
+        """Get tasks ready for execution (dependencies completed).
+
+        Returns tasks that are pending and have all their context_tasks completed.
+        This is useful for parallel execution modes.
 
-        return ready
+        Returns:
+            List of tasks ready to be executed.
+        """
+        return list(self.iter_ready_tasks())
 
     def get_tasks_needing_revision(self) -> list[Task]:
         """Get all tasks that need revision."""
@@ -159,10 +230,10 @@ class Workflow:
         Returns:
             True if workflow was paused, False if not in a pausable state.
         """
-        if self.status == WorkflowStatus.RUNNING:
-            self.status = WorkflowStatus.PAUSED
-            return True
-        return False
+        if self.status not in _ALLOWED_TRANSITIONS["pause"]:
+            return False
+        self.status = WorkflowStatus.PAUSED
+        return True
 
     def resume(self) -> bool:
         """Resume a paused workflow.
@@ -170,15 +241,15 @@ class Workflow:
         Returns:
             True if workflow was resumed, False if not paused.
         """
-        if self.status == WorkflowStatus.PAUSED:
-            self.status = WorkflowStatus.RUNNING
-            return True
-        return False
+        if self.status not in _ALLOWED_TRANSITIONS["resume"]:
+            return False
+        self.status = WorkflowStatus.RUNNING
+        return True
 
     def complete(self, result: WorkflowResult) -> None:
         """Mark the workflow as completed."""
         self.result = result
-        self.status = WorkflowStatus.COMPLETED if result.success else WorkflowStatus.FAILED
+        self.status = _COMPLETE_MAP[bool(result.success)]
         self.completed_at = datetime.now()
 
     def increment_iteration(self) -> bool:
@@ -194,15 +265,9 @@ class Workflow:
 
     def is_complete(self) -> bool:
         """Check if all tasks are completed or failed."""
-        return all(
-            t.status in (TaskStatus.COMPLETED, TaskStatus.FAILED)
-            for t in self.tasks
-        )
+        return all(t.status in _TERMINAL_STATUSES for t in self.tasks)
 
     def get_progress(self) -> tuple[int, int]:
         """Get workflow progress as (completed, total) tasks."""
-        completed = sum(
-            1 for t in self.tasks
-            if t.status in (TaskStatus.COMPLETED, TaskStatus.FAILED)
-        )
+        completed = sum(1 for t in self.tasks if t.status in _TERMINAL_STATUSES)
         return completed, len(self.tasks)
@@ -1,6 +1,7 @@
 """Configuration management for the orchestrator."""
 
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -79,31 +80,39 @@ class OrchestratorConfig:
     extra: dict[str, Any] = field(default_factory=dict)
 
 
-def load_config(config_path: str | None = None) -> OrchestratorConfig:
+def load_config(
+    config_path: str | None = None,
+    env: Mapping[str, str] | None = None,
+) -> OrchestratorConfig:
     """Load configuration from file or environment.
 
     Args:
         config_path: Optional path to a configuration file.
+        env: Environment variables to read overrides from. Defaults to
+            ``os.environ``.
 
     Returns:
         OrchestratorConfig instance.
     """
+    if env is None:
+        env = os.environ
+
     # For now, return default configuration
     # Future: Load from YAML/TOML file if path provided
     config = OrchestratorConfig()
 
     # Override from environment variables
-    if os.environ.get("ORCHESTRATOR_LLM_PROVIDER"):
-        config.llm.provider = os.environ["ORCHESTRATOR_LLM_PROVIDER"]
+    if env.get("ORCHESTRATOR_LLM_PROVIDER"):
+        config.llm.provider = env["ORCHESTRATOR_LLM_PROVIDER"]
 
-    if os.environ.get("ORCHESTRATOR_LLM_MODEL"):
-        config.llm.model = os.environ["ORCHESTRATOR_LLM_MODEL"]
+    if env.get("ORCHESTRATOR_LLM_MODEL"):
+        config.llm.model = env["ORCHESTRATOR_LLM_MODEL"]
 
-    if os.environ.get("ORCHESTRATOR_LOG_LEVEL"):
-        config.observability.log_level = os.environ["ORCHESTRATOR_LOG_LEVEL"]
+    if env.get("ORCHESTRATOR_LOG_LEVEL"):
+        config.observability.log_level = env["ORCHESTRATOR_LOG_LEVEL"]
 
-    if os.environ.get("ORCHESTRATOR_VERBOSE"):
-        config.workflow.verbose = os.environ["ORCHESTRATOR_VERBOSE"].lower() in (
+    if env.get("ORCHESTRATOR_VERBOSE"):
+        config.workflow.verbose = env["ORCHESTRATOR_VERBOSE"].lower() in (
             "true",
             "1",
             "yes",
@@ -8,10 +8,18 @@ import os
 import platform
 import shutil
 from dataclasses import dataclass
-from enum import Enum
+from functools import lru_cache
 
+from ai_meta_orchestrator._compat import StrEnum
 
-class Platform(str, Enum):
+# Host details cannot change during the process lifetime, so query them once
+_SYSTEM = platform.system()
+_RELEASE = platform.release()
+_MACHINE = platform.machine()
+_PYVER = platform.python_version()
+
+
+class Platform(StrEnum):
     """Supported platforms."""
 
     LINUX = "linux"
@@ -46,47 +54,59 @@ class PlatformInfo:
     home_dir: str
 
 
+def _has_wsl_interop() -> bool:
+    """Check whether the WSL interop binfmt handler is registered.
+
+    Returns:
+        True if the WSLInterop entry exists, False otherwise.
+    """
+    return os.path.exists("/proc/sys/fs/binfmt_misc/WSLInterop")
+
+
+@lru_cache(maxsize=1)
 def detect_wsl() -> bool:
     """Detect if running in Windows Subsystem for Linux.
 
+    The result is cached for the lifetime of the process; call
+    ``detect_wsl.cache_clear()`` to force a fresh check.
+
     Returns:
         True if running in WSL, False otherwise.
     """
     # Check for WSL-specific indicators
-    if platform.system() != "Linux":
+    if _SYSTEM != "Linux":
         return False
 
-    # Check /proc/version for Microsoft/WSL
-    try:
-        with open("/proc/version") as f:
-            version_info = f.read().lower()
-            return "microsoft" in version_info or "wsl" in version_info
-    except (FileNotFoundError, PermissionError):
-        pass
-
-    # Check for WSL environment variable
+    # WSL always sets this for processes started inside a distro
     if os.environ.get("WSL_DISTRO_NAME"):
         return True
 
+    # WSL kernels report "microsoft" (and WSL2 kernels "WSL2") in the release
+    release = _RELEASE.lower()
+    if "microsoft" in release or "wsl" in release:
+        return True
+
     # Check for WSL interop
-    return os.path.exists("/proc/sys/fs/binfmt_misc/WSLInterop")
+    return _has_wsl_interop()
 
 
+@lru_cache(maxsize=1)
 def detect_platform() -> Platform:
     """Detect the current platform.
 
+    The result is cached for the lifetime of the process; call
+    ``detect_platform.cache_clear()`` to force a fresh check.
+
     Returns:
         The detected Platform enum value.
     """
-    system = platform.system()
-
-    if system == "Linux":
+    if _SYSTEM == "Linux":
         if detect_wsl():
             return Platform.WSL
         return Platform.LINUX
-    elif system == "Windows":
+    elif _SYSTEM == "Windows":
         return Platform.WINDOWS
-    elif system == "Darwin":
+    elif _SYSTEM == "Darwin":
         return Platform.MACOS
     else:
         return Platform.UNKNOWN
@@ -132,10 +152,10 @@ def get_platform_info() -> PlatformInfo:
 
     return PlatformInfo(
         platform=detected_platform,
-        system=platform.system(),
-        release=platform.release(),
-        machine=platform.machine(),
-        python_version=platform.python_version(),
+        system=_SYSTEM,
+        release=_RELEASE,
+        machine=_MACHINE,
+        python_version=_PYVER,
         is_wsl=is_wsl,
         shell=get_default_shell(),
         home_dir=os.path.expanduser("~"),
@@ -45,7 +45,7 @@ def print_platform_info(platform_info: PlatformInfo) -> None:
     Args:
         platform_info: Platform information to print.
     """
-    print(f"Platform: {platform_info.platform.value}")
+    print(f"Platform: {platform_info.platform}")
     print(f"System: {platform_info.system} {platform_info.release}")
     print(f"Python: {platform_info.python_version}")
     if platform_info.is_wsl:
@@ -289,7 +289,7 @@ def cmd_templates(category: str | None = None) -> None:
 
     for template in templates:
         print(f"📋 {template.name} (v{template.version})")
-        print(f"   Category: {template.category.value}")
+        print(f"   Category: {template.category}")
         print(f"   Description: {template.description}")
         print(f"   Required params: {', '.join(template.required_params)}")
         if template.optional_params:
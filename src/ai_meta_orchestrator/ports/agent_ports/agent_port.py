@@ -1,12 +1,13 @@
 """Agent port interface - Abstraction for agent operations."""
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
+from typing import Protocol
 
 from ai_meta_orchestrator.domain.agents.agent_models import AgentConfig, AgentRole
 from ai_meta_orchestrator.domain.tasks.task_models import Task, TaskResult
 
 
-class AgentPort(ABC):
+class AgentPort(Protocol):
     """Abstract interface for agent operations.
 
     This port defines the contract that any agent implementation must fulfill,
@@ -50,7 +51,7 @@ class AgentPort(ABC):
         pass
 
 
-class AgentFactoryPort(ABC):
+class AgentFactoryPort(Protocol):
     """Abstract factory interface for creating agents."""
 
     @abstractmethod
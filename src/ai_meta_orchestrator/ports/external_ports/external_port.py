@@ -1,12 +1,15 @@
 """External system port interfaces - Abstractions for external integrations."""
 
-from abc import ABC, abstractmethod
+import asyncio
+from abc import abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
-from enum import Enum
-from typing import Any
+from typing import Any, Protocol
 
+from ai_meta_orchestrator._compat import StrEnum
 
-class ExternalCLIType(str, Enum):
+
+class ExternalCLIType(StrEnum):
     """Types of external CLI integrations."""
 
     GEMINI = "gemini"
@@ -15,7 +18,7 @@ class ExternalCLIType(str, Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(slots=True)
 class CLICommandResult:
     """Result of executing an external CLI command.
 
@@ -32,7 +35,7 @@ class CLICommandResult:
     exit_code: int = 0
 
 
-class ExternalCLIPort(ABC):
+class ExternalCLIPort(Protocol):
     """Abstract interface for external CLI operations.
 
     This port allows integration with external CLI tools like Gemini CLI,
@@ -67,8 +70,35 @@ class ExternalCLIPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def execute_async(self, command: str, **kwargs: Any) -> CLICommandResult:
+        """Execute a CLI command without blocking the event loop.
+
+        Args:
+            command: The command to execute.
+            **kwargs: Additional arguments for the command.
 
-class CredentialManagerPort(ABC):
+        Returns:
+            CLICommandResult containing the output or error.
+        """
+        pass
+
+    async def execute_many(self, commands: list[str], **kwargs: Any) -> list[CLICommandResult]:
+        """Execute several CLI commands concurrently.
+
+        Args:
+            commands: The commands to execute.
+            **kwargs: Additional arguments applied to every command.
+
+        Returns:
+            Results in the same order as ``commands``.
+        """
+        return list(
+            await asyncio.gather(*(self.execute_async(command, **kwargs) for command in commands))
+        )
+
+
+class CredentialManagerPort(Protocol):
     """Abstract interface for credential management.
 
     Placeholder for future credential management implementation.
@@ -112,7 +142,7 @@ class CredentialManagerPort(ABC):
         pass
 
 
-class GitCICDPort(ABC):
+class GitCICDPort(Protocol):
     """Abstract interface for Git and CI/CD operations.
 
     Placeholder for future Git/CI-CD integration.
@@ -164,7 +194,7 @@ class GitCICDPort(ABC):
         pass
 
 
-class ObservabilityPort(ABC):
+class ObservabilityPort(Protocol):
     """Abstract interface for observability and monitoring.
 
     Placeholder for future observability implementation.
@@ -193,6 +223,42 @@ class ObservabilityPort(ABC):
         """
         pass
 
+    def log_events(self, events: Sequence[tuple[str, dict[str, Any]]]) -> None:
+        """Log several events at once.
+
+        The default implementation calls log_event for each event; adapters
+        that can emit a batch in one go should override it.
+
+        Args:
+            events: (event_name, data) pairs to log.
+        """
+        for event_name, data in events:
+            self.log_event(event_name, data)
+
+    def record_metrics(
+        self,
+        names: Sequence[str],
+        values: Sequence[float],
+        tags: Sequence[dict[str, str] | None] | None = None,
+    ) -> None:
+        """Record several metrics at once.
+
+        The default implementation calls record_metric for each metric;
+        adapters that can export a batch in one go should override it.
+
+        Args:
+            names: Names of the metrics.
+            values: Metric values, aligned with ``names``.
+            tags: Optional per-metric tags, aligned with ``names``.
+
+        Raises:
+            ValueError: If the sequences have different lengths.
+        """
+        for name, value, metric_tags in zip(
+            names, values, tags if tags is not None else [None] * len(names), strict=True
+        ):
+            self.record_metric(name, value, metric_tags)
+
     @abstractmethod
     def start_span(self, operation_name: str) -> str:
         """Start a tracing span.
@@ -1,13 +1,21 @@
 """Task port interface - Abstraction for task operations."""
 
-from abc import ABC, abstractmethod
+import asyncio
+from abc import abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Protocol
 from uuid import UUID
 
 from ai_meta_orchestrator.domain.tasks.task_models import EvaluationResult, Task, TaskResult
 
 
-class TaskExecutorPort(ABC):
-    """Abstract interface for task execution operations."""
+class TaskExecutorPort(Protocol):
+    """Abstract interface for task execution operations.
+
+    ``execute_async`` runs the synchronous ``execute`` in a worker thread by
+    default; adapters with a native asynchronous API can override it.
+    """
 
     @abstractmethod
     def execute(self, task: Task) -> TaskResult:
@@ -33,8 +41,19 @@ class TaskExecutorPort(ABC):
         """
         pass
 
+    async def execute_async(self, task: Task) -> TaskResult:
+        """Execute a task without blocking the event loop.
+
+        Args:
+            task: The task to execute.
+
+        Returns:
+            TaskResult containing the output or error.
+        """
+        return await asyncio.to_thread(self.execute, task)
+
 
-class TaskEvaluatorPort(ABC):
+class TaskEvaluatorPort(Protocol):
     """Abstract interface for task evaluation operations."""
 
     @abstractmethod
@@ -51,8 +70,12 @@ class TaskEvaluatorPort(ABC):
         pass
 
 
-class TaskDistributorPort(ABC):
-    """Abstract interface for task distribution operations."""
+class TaskDistributorPort(Protocol):
+    """Abstract interface for task distribution operations.
+
+    The asynchronous variants are built on top of ``distribute`` and
+    ``reassign`` so existing implementations get them for free.
+    """
 
     @abstractmethod
     def distribute(self, tasks: list[Task]) -> dict[UUID, UUID]:
@@ -78,3 +101,89 @@ class TaskDistributorPort(ABC):
             True if reassignment was successful, False otherwise.
         """
         pass
+
+    async def reassign_async(self, task: Task, feedback: str) -> bool:
+        """Reassign a task without blocking the event loop.
+
+        Args:
+            task: The task to reassign.
+            feedback: Feedback explaining why reassignment is needed.
+
+        Returns:
+            True if reassignment was successful, False otherwise.
+        """
+        return await asyncio.to_thread(self.reassign, task, feedback)
+
+    async def distribute_async(
+        self,
+        tasks: list[Task],
+        executor: TaskExecutorPort,
+        max_parallel: int = 4,
+    ) -> AsyncIterator[tuple[UUID, UUID]]:
+        """Distribute tasks and execute them concurrently in dependency order.
+
+        A task is dispatched as soon as all of its ``context_tasks`` that are
+        part of ``tasks`` have finished, so independent tasks overlap instead
+        of waiting on each other. Dependencies outside ``tasks`` are treated
+        as already satisfied.
+
+        Args:
+            tasks: The tasks to distribute.
+            executor: Executor used to run each task.
+            max_parallel: Maximum number of tasks executing at the same time.
+
+        Yields:
+            (task_id, agent_id) pairs as each task finishes executing.
+
+        Raises:
+            ValueError: If max_parallel is less than 1 or ``distribute`` leaves
+                a task unassigned (both before anything runs), or if tasks
+                could not be dispatched because of a dependency cycle (after
+                every other task has finished).
+        """
+        if max_parallel < 1:
+            raise ValueError(f"max_parallel must be at least 1, got {max_parallel}")
+
+        assignments = self.distribute(tasks)
+        unassigned = [str(task.id) for task in tasks if task.id not in assignments]
+        if unassigned:
+            raise ValueError(f"Tasks not assigned to an agent: {', '.join(unassigned)}")
+
+        task_ids = {task.id for task in tasks}
+        remaining: dict[UUID, int] = {}
+        dependents: dict[UUID, list[Task]] = {}
+        ready: deque[Task] = deque()
+
+        for task in tasks:
+            deps = {dep_id for dep_id in task.context_tasks if dep_id in task_ids}
+            remaining[task.id] = len(deps)
+            for dep_id in deps:
+                dependents.setdefault(dep_id, []).append(task)
+            if not deps:
+                ready.append(task)
+
+        in_flight: dict[asyncio.Task[TaskResult], Task] = {}
+        try:
+            while ready or in_flight:
+                while ready and len(in_flight) < max_parallel:
+                    task = ready.popleft()
+                    in_flight[asyncio.create_task(executor.execute_async(task))] = task
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    task = in_flight.pop(future)
+                    future.result()
+                    for dependent in dependents.pop(task.id, ()):
+                        remaining[dependent.id] -= 1
+                        if remaining[dependent.id] == 0:
+                            ready.append(dependent)
+                    yield task.id, assignments[task.id]
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+        blocked = [str(task.id) for task in tasks if remaining[task.id] > 0]
+        if blocked:
+            raise ValueError(
+                f"Tasks have unresolvable dependencies: {', '.join(blocked)}"
+            )
@@ -0,0 +1,39 @@
+"""Factories for domain objects used across unit tests."""
+
+from typing import Any
+
+from ai_meta_orchestrator.domain.agents.agent_models import AgentRole
+from ai_meta_orchestrator.domain.tasks.task_models import Task
+from ai_meta_orchestrator.domain.workflows.workflow_models import Workflow
+
+
+def make_workflow(**overrides: Any) -> Workflow:
+    """Create a workflow with test defaults.
+
+    Args:
+        **overrides: Field values replacing the defaults.
+
+    Returns:
+        A new Workflow.
+    """
+    fields: dict[str, Any] = {"name": "Test", "description": "Test"}
+    fields.update(overrides)
+    return Workflow(**fields)
+
+
+def make_task(**overrides: Any) -> Task:
+    """Create a task with test defaults.
+
+    Args:
+        **overrides: Field values replacing the defaults.
+
+    Returns:
+        A new Task.
+    """
+    fields: dict[str, Any] = {
+        "name": "Test Task",
+        "description": "Task description",
+        "assigned_to": AgentRole.DEV,
+    }
+    fields.update(overrides)
+    return Task(**fields)
@@ -1,9 +1,14 @@
 """Unit tests for adapters."""
 
+import asyncio
 import os
+import sys
 import warnings
+from typing import Any
 from unittest.mock import patch
 
+import pytest
+
 from ai_meta_orchestrator.adapters.credentials.credential_adapter import (
     PlaceholderCredentialManager,
 )
@@ -89,6 +94,19 @@ class TestCLIAdapters:
         adapter = get_cli_adapter(ExternalCLIType.CUSTOM)
         assert isinstance(adapter, PlaceholderCLIAdapter)
 
+    def test_executable_resolved_once(self) -> None:
+        """Test the executable is resolved at construction and on refresh only."""
+        with patch("shutil.which", return_value="/usr/bin/openai") as mock_which:
+            adapter = CodexCLIAdapter()
+            adapter.is_available()
+            adapter.is_available()
+            assert mock_which.call_count == 1
+
+        with patch("shutil.which", return_value=None):
+            assert adapter.is_available() is True
+            adapter.refresh_environment()
+            assert adapter.is_available() is False
+
     def test_cli_config_defaults(self) -> None:
         """Test CLIConfig dataclass defaults."""
         config = CLIConfig(executable="test")
@@ -133,20 +151,98 @@ class TestCLIAdapters:
 
         # No API key set
         with patch.dict(os.environ, {}, clear=True):
+            adapter.refresh_environment()
             assert adapter.is_authenticated() is False
             assert adapter.get_api_key() is None
 
         # GOOGLE_API_KEY set
         with patch.dict(os.environ, {"GOOGLE_API_KEY": "test-key"}, clear=True):
+            adapter.refresh_environment()
             assert adapter.is_authenticated() is True
             assert adapter.get_api_key() == "test-key"
 
         # GEMINI_API_KEY set
         with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key2"}, clear=True):
+            adapter.refresh_environment()
             assert adapter.is_authenticated() is True
             assert adapter.get_api_key() == "test-key2"
 
 
+class TestCLIAdaptersAsync:
+    """Tests for asynchronous CLI adapter execution."""
+
+    @pytest.mark.asyncio
+    async def test_execute_async_returns_not_found_when_cli_missing(self) -> None:
+        """Test execute_async returns CLI not found error when executable missing."""
+        with patch("shutil.which", return_value=None):
+            adapter = GeminiCLIAdapter()
+            result = await adapter.execute_async("test command")
+            assert result.success is False
+            assert result.exit_code == 127
+
+    @pytest.mark.asyncio
+    async def test_execute_async_captures_output(self) -> None:
+        """Test execute_async runs the command and captures stdout."""
+        adapter = BaseCLIAdapter(ExternalCLIType.CUSTOM, CLIConfig(executable=sys.executable))
+        result = await adapter.execute_async("-c", args=["print('hello')"])
+        assert result.success is True
+        assert result.output.strip() == "hello"
+        assert result.exit_code == 0
+
+    @pytest.mark.asyncio
+    async def test_execute_async_passes_input_text(self) -> None:
+        """Test execute_async writes input_text to stdin."""
+        adapter = BaseCLIAdapter(ExternalCLIType.CUSTOM, CLIConfig(executable=sys.executable))
+        result = await adapter.execute_async(
+            "-c",
+            args=["import sys; print(sys.stdin.read().upper())"],
+            input_text="prompt",
+        )
+        assert result.output.strip() == "PROMPT"
+
+    @pytest.mark.asyncio
+    async def test_execute_async_times_out(self) -> None:
+        """Test execute_async kills the process when the timeout expires."""
+        adapter = BaseCLIAdapter(ExternalCLIType.CUSTOM, CLIConfig(executable=sys.executable))
+        result = await adapter.execute_async(
+            "-c", args=["import time; time.sleep(10)"], timeout=0.2
+        )
+        assert result.success is False
+        assert result.exit_code == 124
+
+    @pytest.mark.asyncio
+    async def test_execute_async_kills_process_when_cancelled(self) -> None:
+        """Test cancelling execute_async terminates the child process."""
+        adapter = BaseCLIAdapter(ExternalCLIType.CUSTOM, CLIConfig(executable=sys.executable))
+        processes: list[asyncio.subprocess.Process] = []
+        create_process = asyncio.create_subprocess_exec
+
+        async def record_process(*args: Any, **kwargs: Any) -> asyncio.subprocess.Process:
+            process = await create_process(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        with patch("asyncio.create_subprocess_exec", side_effect=record_process):
+            task = asyncio.create_task(
+                adapter.execute_async("-c", args=["import time; time.sleep(10)"])
+            )
+            while not processes:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert processes[0].returncode is not None
+
+    @pytest.mark.asyncio
+    async def test_execute_many_preserves_order(self) -> None:
+        """Test execute_many returns one result per command in order."""
+        adapter = BaseCLIAdapter(ExternalCLIType.CUSTOM, CLIConfig(executable=sys.executable))
+        results = await adapter.execute_many(["-c print(1)", "-c print(2)", "-c exit(3)"])
+        assert [r.output.strip() for r in results] == ["1", "2", ""]
+        assert [r.exit_code for r in results] == [0, 0, 3]
+
+
 class TestCredentialManager:
     """Tests for credential manager adapter."""
 
@@ -224,6 +320,35 @@ class TestObservabilityAdapter:
         # Should not raise
         adapter.record_metric("test_metric", 42.0, {"tag": "value"})
 
+    def test_record_metrics_batch(self) -> None:
+        """Test recording a batch of metrics emits a single log record."""
+        adapter = PlaceholderObservabilityAdapter()
+        with (
+            patch.object(adapter._logger, "isEnabledFor", return_value=True),
+            patch.object(adapter._logger, "debug") as mock_debug,
+        ):
+            adapter.record_metrics(
+                ["tokens", "duration"], [120.0, 1.5], [{"agent": "dev"}, None]
+            )
+        mock_debug.assert_called_once()
+        assert "tokens=120.0" in mock_debug.call_args.args[0]
+
+    def test_record_metrics_length_mismatch(self) -> None:
+        """Test recording a batch with misaligned sequences raises."""
+        adapter = PlaceholderObservabilityAdapter()
+        with pytest.raises(ValueError):
+            adapter.record_metrics(["tokens", "duration"], [120.0])
+
+    def test_log_events_batch(self) -> None:
+        """Test logging a batch of events emits a single log record."""
+        adapter = PlaceholderObservabilityAdapter()
+        with (
+            patch.object(adapter._logger, "isEnabledFor", return_value=True),
+            patch.object(adapter._logger, "info") as mock_info,
+        ):
+            adapter.log_events([("task_started", {"id": 1}), ("task_completed", {"id": 1})])
+        mock_info.assert_called_once()
+
     def test_span_lifecycle(self) -> None:
         """Test span start and end."""
         adapter = PlaceholderObservabilityAdapter()
@@ -235,6 +360,12 @@ class TestObservabilityAdapter:
         # Should not raise
         adapter.end_span(span_id, "ok")
 
+    def test_span_ids_are_unique(self) -> None:
+        """Test that concurrent spans get distinct IDs."""
+        adapter = PlaceholderObservabilityAdapter()
+        span_ids = {adapter.start_span("op") for _ in range(3)}
+        assert len(span_ids) == 3
+
     def test_end_nonexistent_span(self) -> None:
         """Test ending a non-existent span."""
         adapter = PlaceholderObservabilityAdapter()
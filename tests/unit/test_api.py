@@ -1,28 +1,91 @@
 """Unit tests for the REST API."""
 
+import json
+from collections.abc import Iterator
+from typing import Any
+from uuid import uuid4
+
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from ai_meta_orchestrator import __version__
+from ai_meta_orchestrator.api import routes
 from ai_meta_orchestrator.api.app import create_app
+from ai_meta_orchestrator.api.models import WorkflowResultResponse
 
 
-@pytest.fixture
-def client() -> TestClient:
-    """Create a test client."""
-    app = create_app()
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """Create the application once for the whole test session."""
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def client(app: FastAPI) -> TestClient:
+    """Create a test client shared by all API tests."""
     return TestClient(app)
 
 
+async def call_endpoint(app: FastAPI, path: str) -> tuple[int, Any]:
+    """Call a GET endpoint through the raw ASGI interface.
+
+    Skips the HTTP client layer for tests that only exercise handler logic.
+
+    Args:
+        app: The ASGI application.
+        path: The request path.
+
+    Returns:
+        The response status code and decoded JSON body.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    messages: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)
+    status_code = next(m["status"] for m in messages if m["type"] == "http.response.start")
+    body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    return status_code, json.loads(body)
+
+
+@pytest.fixture
+def clean_workflows() -> Iterator[None]:
+    """Clear the in-memory workflow store around tests that write to it."""
+    routes._workflows.clear()
+    routes._workflow_results.clear()
+    yield
+    routes._workflows.clear()
+    routes._workflow_results.clear()
+
+
 class TestHealthEndpoint:
     """Tests for health check endpoint."""
 
-    def test_health_check(self, client: TestClient) -> None:
+    @pytest.mark.asyncio
+    async def test_health_check(self, app: FastAPI) -> None:
         """Test health check returns healthy status."""
-        response = client.get("/health")
+        status_code, data = await call_endpoint(app, "/health")
 
-        assert response.status_code == 200
-        data = response.json()
+        assert status_code == 200
         assert data["status"] == "healthy"
         assert data["version"] == __version__
         assert "uptime_seconds" in data
@@ -31,12 +94,12 @@ class TestHealthEndpoint:
 class TestRootEndpoint:
     """Tests for root endpoint."""
 
-    def test_root_returns_info(self, client: TestClient) -> None:
+    @pytest.mark.asyncio
+    async def test_root_returns_info(self, app: FastAPI) -> None:
         """Test root endpoint returns API info."""
-        response = client.get("/")
+        status_code, data = await call_endpoint(app, "/")
 
-        assert response.status_code == 200
-        data = response.json()
+        assert status_code == 200
         assert data["name"] == "AI Meta Orchestrator API"
         assert data["version"] == __version__
         assert data["docs"] == "/docs"
@@ -71,6 +134,7 @@ class TestAgentsEndpoints:
         assert response.status_code == 422  # Invalid enum value
 
 
+@pytest.mark.usefixtures("clean_workflows")
 class TestWorkflowsEndpoints:
     """Tests for workflows endpoints."""
 
@@ -80,8 +144,8 @@ class TestWorkflowsEndpoints:
 
         assert response.status_code == 200
         data = response.json()
-        assert "workflows" in data
-        assert isinstance(data["workflows"], list)
+        assert data["workflows"] == []
+        assert data["total"] == 0
 
     def test_create_workflow(self, client: TestClient) -> None:
         """Test creating a workflow."""
@@ -146,7 +210,36 @@ class TestWorkflowsEndpoints:
         assert len(data["tasks"]) == 1
         assert data["tasks"][0]["name"] == "Task 1"
 
+    def test_get_workflow_result(self, client: TestClient) -> None:
+        """Test getting a stored workflow result."""
+        workflow_id = uuid4()
+        routes._workflow_results[workflow_id] = WorkflowResultResponse(
+            workflow_id=workflow_id,
+            success=True,
+            tasks_completed=2,
+            tasks_failed=0,
+            total_iterations=1,
+            duration_seconds=1.5,
+            outputs={"summary": "done"},
+        )
+
+        response = client.get(f"/workflows/{workflow_id}/result")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["workflow_id"] == str(workflow_id)
+        assert data["tasks_completed"] == 2
+        assert data["outputs"] == {"summary": "done"}
+        assert data["errors"] == []
+
+    def test_get_workflow_result_not_found(self, client: TestClient) -> None:
+        """Test getting the result of a workflow that has not run."""
+        response = client.get(f"/workflows/{uuid4()}/result")
+
+        assert response.status_code == 404
+
 
+@pytest.mark.usefixtures("clean_workflows")
 class TestTemplatesEndpoints:
     """Tests for templates endpoints."""
 
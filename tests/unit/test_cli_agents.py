@@ -48,6 +48,22 @@ class TestExternalCLIAgent:
         assert agent.config.goal == "Custom goal"
         assert agent.config.backstory == "Custom backstory"
 
+    def test_default_config_per_class_and_role(self) -> None:
+        """Test default configs depend on the agent class and role."""
+        assert GeminiAgent().config == GeminiAgent().config
+        assert GeminiAgent().config != GeminiAgent(role=AgentRole.QA).config
+        assert GeminiAgent().config != CodexAgent().config
+
+    def test_default_config_not_shared_between_agents(self) -> None:
+        """Test mutating one agent's default config does not affect another."""
+        agent = GeminiAgent()
+        agent.config.tools.append("search")
+        agent.config.goal = "Changed goal"
+
+        other = GeminiAgent()
+        assert other.config.tools == []
+        assert other.config.goal != "Changed goal"
+
     def test_is_available_checks_adapter(self) -> None:
         """Test is_available delegates to adapter."""
         config = CLIConfig(executable="test")
@@ -85,6 +101,24 @@ class TestExternalCLIAgent:
         assert "Do something" in prompt
         assert "Result" in prompt
 
+    def test_format_task_as_prompt_includes_context(self) -> None:
+        """Test task context metadata is appended to the prompt."""
+        config = CLIConfig(executable="test")
+        adapter = BaseCLIAdapter(ExternalCLIType.CUSTOM, config)
+        agent = ExternalCLIAgent(adapter, AgentRole.DEV)
+
+        task = Task(
+            name="Test Task",
+            description="Do something",
+            assigned_to=AgentRole.DEV,
+            metadata={"context": {"repo": "demo"}},
+        )
+
+        prompt = agent._format_task_as_prompt(task)
+        assert prompt == (
+            "Task: Test Task\n\nDescription: Do something\n\nContext: {'repo': 'demo'}"
+        )
+
     def test_can_handle_checks_role(self) -> None:
         """Test can_handle checks role assignment."""
         config = CLIConfig(executable="test")
@@ -3,6 +3,8 @@
 import os
 from unittest.mock import patch
 
+import pytest
+
 from ai_meta_orchestrator.infrastructure.config import (
     LLMConfig,
     ObservabilityConfig,
@@ -95,14 +97,24 @@ class TestLoadConfig:
             assert config.observability.log_level == "DEBUG"
             assert config.workflow.verbose is False
 
-    def test_load_config_verbose_variations(self) -> None:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("true", True),
+            ("1", True),
+            ("yes", True),
+            ("false", False),
+            ("0", False),
+            ("no", False),
+        ],
+    )
+    def test_load_config_verbose_variations(self, value: str, expected: bool) -> None:
         """Test verbose flag with different values."""
-        for value in ["true", "1", "yes"]:
-            with patch.dict(os.environ, {"ORCHESTRATOR_VERBOSE": value}):
-                config = load_config()
-                assert config.workflow.verbose is True
-
-        for value in ["false", "0", "no"]:
-            with patch.dict(os.environ, {"ORCHESTRATOR_VERBOSE": value}):
-                config = load_config()
-                assert config.workflow.verbose is False
+        config = load_config(env={"ORCHESTRATOR_VERBOSE": value})
+        assert config.workflow.verbose is expected
+
+    def test_load_config_explicit_env_ignores_os_environ(self) -> None:
+        """Test that an explicit env mapping replaces os.environ."""
+        with patch.dict(os.environ, {"ORCHESTRATOR_LLM_MODEL": "from-os"}):
+            config = load_config(env={})
+        assert config.llm.model == LLMConfig().model
@@ -2,6 +2,9 @@
 
 import os
 import tempfile
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
 
 import pytest
 
@@ -21,6 +24,8 @@ from ai_meta_orchestrator.domain.workflows.workflow_models import (
     WorkflowStatus,
 )
 
+from ._factories import make_task, make_workflow
+
 
 class TestInMemoryPersistence:
     """Tests for InMemoryPersistence."""
@@ -66,6 +71,32 @@ class TestInMemoryPersistence:
         assert len(running) == 1
         assert running[0].status == WorkflowStatus.RUNNING
 
+    def test_list_workflows_status_filter_follows_saves(self) -> None:
+        """Test that re-saving a workflow moves it between status filters."""
+        persistence = InMemoryPersistence()
+        workflow = Workflow(name="Workflow", description="Desc")
+        persistence.save_workflow(workflow)
+
+        workflow.start()
+        persistence.save_workflow(workflow)
+
+        assert persistence.list_workflows(status=WorkflowStatus.NOT_STARTED) == []
+        assert persistence.list_workflows(status=WorkflowStatus.RUNNING) == [workflow]
+
+        persistence.delete_workflow(workflow.id)
+        assert persistence.list_workflows(status=WorkflowStatus.RUNNING) == []
+
+    def test_list_workflows_status_filter_uses_live_status(self) -> None:
+        """Test that status filtering sees transitions made without re-saving."""
+        persistence = InMemoryPersistence()
+        workflow = make_workflow()
+        persistence.save_workflow(workflow)
+
+        workflow.start()
+
+        assert persistence.list_workflows(status=WorkflowStatus.NOT_STARTED) == []
+        assert persistence.list_workflows(status=WorkflowStatus.RUNNING) == [workflow]
+
     def test_delete_workflow(self) -> None:
         """Test deleting a workflow."""
         persistence = InMemoryPersistence()
@@ -123,12 +154,8 @@ class TestSQLitePersistence:
 
     @pytest.fixture
     def temp_db(self) -> str:
-        """Create a temporary database file."""
-        fd, path = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
-        yield path
-        if os.path.exists(path):
-            os.remove(path)
+        """Return a URI for a private in-memory database."""
+        return f"file:memdb_{uuid4().hex}?mode=memory&cache=shared"
 
     def test_save_and_get_workflow(self, temp_db: str) -> None:
         """Test saving and retrieving a workflow."""
@@ -179,6 +206,29 @@ class TestSQLitePersistence:
 
         persistence.close()
 
+    def test_resave_workflow_updates_tasks(self, temp_db: str) -> None:
+        """Test that saving a workflow again replaces its task rows."""
+        config = PersistenceConfig(database_path=temp_db)
+        persistence = SQLitePersistence(config)
+
+        workflow = Workflow(name="Test", description="Test")
+        task = Task(name="Task 1", description="Desc", assigned_to=AgentRole.DEV)
+        workflow.add_task(task)
+        persistence.save_workflow(workflow)
+
+        task.revision_count = 2
+        workflow.add_task(
+            Task(name="Task 2", description="Desc", assigned_to=AgentRole.QA)
+        )
+        assert persistence.save_workflow(workflow)
+
+        retrieved = persistence.get_workflow(workflow.id)
+        assert retrieved is not None
+        assert [t.name for t in retrieved.tasks] == ["Task 1", "Task 2"]
+        assert retrieved.tasks[0].revision_count == 2
+
+        persistence.close()
+
     def test_list_workflows(self, temp_db: str) -> None:
         """Test listing workflows."""
         config = PersistenceConfig(database_path=temp_db)
@@ -195,6 +245,35 @@ class TestSQLitePersistence:
 
         persistence.close()
 
+    def test_list_workflows_filters_and_loads_children(self, temp_db: str) -> None:
+        """Test status filtering, paging and batched task/result loading."""
+        config = PersistenceConfig(database_path=temp_db)
+        persistence = SQLitePersistence(config)
+
+        workflows = [make_workflow(name=f"Workflow {i}") for i in range(3)]
+        for workflow in workflows:
+            workflow.add_task(make_task(name=f"{workflow.name} task"))
+            workflow.start()
+            persistence.save_workflow(workflow)
+        idle = make_workflow(name="Idle")
+        persistence.save_workflow(idle)
+        persistence.update_workflow_result(
+            workflows[1].id, WorkflowResult(success=True, tasks_completed=1)
+        )
+
+        running = persistence.list_workflows(status=WorkflowStatus.RUNNING)
+        assert [w.name for w in running] == ["Workflow 0", "Workflow 1", "Workflow 2"]
+        assert [t.name for t in running[1].tasks] == ["Workflow 1 task"]
+        assert running[1].result is not None
+        assert running[1].result.tasks_completed == 1
+        assert running[0].result is None
+
+        page = persistence.list_workflows(status=WorkflowStatus.RUNNING, limit=1, offset=2)
+        assert [w.name for w in page] == ["Workflow 2"]
+        assert len(persistence.list_workflows()) == 4
+
+        persistence.close()
+
     def test_delete_workflow(self, temp_db: str) -> None:
         """Test deleting a workflow."""
         config = PersistenceConfig(database_path=temp_db)
@@ -246,6 +325,55 @@ class TestSQLitePersistence:
 
         persistence.close()
 
+    def test_metadata_round_trip(self, temp_db: str) -> None:
+        """Test JSON metadata columns round-trip, stringifying unknown types."""
+        config = PersistenceConfig(database_path=temp_db)
+        persistence = SQLitePersistence(config)
+
+        run_id = uuid4()
+        workflow = Workflow(
+            name="Test",
+            description="Test",
+            metadata={"attempts": 2, "labels": ["a", "b"], "run_id": run_id},
+        )
+        persistence.save_workflow(workflow)
+        retrieved = persistence.get_workflow(workflow.id)
+
+        assert retrieved is not None
+        assert retrieved.metadata == {
+            "attempts": 2,
+            "labels": ["a", "b"],
+            "run_id": str(run_id),
+        }
+
+        persistence.close()
+
+    def test_metadata_encoding_matches_stdlib_json(self, temp_db: str) -> None:
+        """Test datetimes and integers wider than 64 bits encode like stdlib json."""
+        config = PersistenceConfig(database_path=temp_db)
+        persistence = SQLitePersistence(config)
+
+        when = datetime(2026, 1, 2, 3, 4, 5)
+        workflow = make_workflow(metadata={"when": when, "big": 2**70})
+        assert persistence.save_workflow(workflow)
+        retrieved = persistence.get_workflow(workflow.id)
+
+        assert retrieved is not None
+        assert retrieved.metadata == {"when": "2026-01-02T03:04:05", "big": 2**70}
+
+        persistence.close()
+
+    def test_sqlite_file_database_uses_wal(self, tmp_path: Path) -> None:
+        """Test that file-backed databases are opened in WAL mode."""
+        adapter = SQLitePersistence(
+            PersistenceConfig(database_path=str(tmp_path / "orchestrator.db"))
+        )
+        try:
+            mode = adapter._get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+            assert mode == "wal"
+        finally:
+            adapter.close()
+
 
 class TestCreatePersistenceAdapter:
     """Tests for create_persistence_adapter factory."""
@@ -2,7 +2,10 @@
 
 import os
 import platform
-from unittest.mock import mock_open, patch
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
 
 from ai_meta_orchestrator.infrastructure.platform import (
     Platform,
@@ -14,40 +17,72 @@ from ai_meta_orchestrator.infrastructure.platform import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_platform_caches() -> Iterator[None]:
+    """Reset cached detection results so patched values are observed."""
+    detect_wsl.cache_clear()
+    detect_platform.cache_clear()
+    yield
+    detect_wsl.cache_clear()
+    detect_platform.cache_clear()
+
+
 class TestDetectWSL:
     """Tests for WSL detection."""
 
     def test_not_linux_returns_false(self) -> None:
         """Test that non-Linux systems return False."""
-        with patch("platform.system", return_value="Windows"):
+        with patch("ai_meta_orchestrator.infrastructure.platform._SYSTEM", "Windows"):
             assert detect_wsl() is False
 
-    def test_linux_without_wsl_indicators(self) -> None:
+    def test_linux_without_wsl_indicators(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test Linux without WSL indicators."""
+        monkeypatch.setattr(
+            "ai_meta_orchestrator.infrastructure.platform._has_wsl_interop", lambda: False
+        )
         with (
-            patch("platform.system", return_value="Linux"),
-            patch("builtins.open", mock_open(read_data="Linux version 5.4.0")),
+            patch("ai_meta_orchestrator.infrastructure.platform._SYSTEM", "Linux"),
+            patch("ai_meta_orchestrator.infrastructure.platform._RELEASE", "5.4.0-generic"),
             patch.dict(os.environ, {}, clear=True),
-            patch("os.path.exists", return_value=False),
         ):
             assert detect_wsl() is False
 
-    def test_linux_with_microsoft_in_proc_version(self) -> None:
-        """Test Linux with Microsoft in /proc/version."""
+    def test_linux_with_wsl_interop(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test Linux with only the WSL interop handler registered."""
+        monkeypatch.setattr(
+            "ai_meta_orchestrator.infrastructure.platform._has_wsl_interop", lambda: True
+        )
         with (
-            patch("platform.system", return_value="Linux"),
-            patch("builtins.open", mock_open(read_data="Linux version 5.4.0-microsoft-standard")),
+            patch("ai_meta_orchestrator.infrastructure.platform._SYSTEM", "Linux"),
+            patch("ai_meta_orchestrator.infrastructure.platform._RELEASE", "5.4.0-generic"),
+            patch.dict(os.environ, {}, clear=True),
+        ):
+            assert detect_wsl() is True
+
+    def test_linux_with_microsoft_in_release(self) -> None:
+        """Test Linux with Microsoft in the kernel release."""
+        with (
+            patch("ai_meta_orchestrator.infrastructure.platform._SYSTEM", "Linux"),
+            patch(
+                "ai_meta_orchestrator.infrastructure.platform._RELEASE",
+                "5.4.0-microsoft-standard",
+            ),
+            patch.dict(os.environ, {}, clear=True),
         ):
             assert detect_wsl() is True
 
     def test_linux_with_wsl_env_var(self) -> None:
         """Test Linux with WSL_DISTRO_NAME environment variable."""
         with (
-            patch("platform.system", return_value="Linux"),
-            patch("builtins.open", side_effect=FileNotFoundError),
+            patch("ai_meta_orchestrator.infrastructure.platform._SYSTEM", "Linux"),
+            patch("ai_meta_orchestrator.infrastructure.platform._RELEASE", "5.4.0-generic"),
             patch.dict(os.environ, {"WSL_DISTRO_NAME": "Ubuntu"}, clear=True),
+            patch(
+                "ai_meta_orchestrator.infrastructure.platform._has_wsl_interop"
+            ) as has_interop,
         ):
             assert detect_wsl() is True
+            has_interop.assert_not_called()
 
 
 class TestDetectPlatform:
@@ -55,18 +90,18 @@ class TestDetectPlatform:
 
     def test_detect_windows(self) -> None:
         """Test detecting Windows platform."""
-        with patch("platform.system", return_value="Windows"):
+        with patch("ai_meta_orchestrator.infrastructure.platform._SYSTEM", "Windows"):
             assert detect_platform() == Platform.WINDOWS
 
     def test_detect_macos(self) -> None:
         """Test detecting macOS platform."""
-        with patch("platform.system", return_value="Darwin"):
+        with patch("ai_meta_orchestrator.infrastructure.platform._SYSTEM", "Darwin"):
             assert detect_platform() == Platform.MACOS
 
     def test_detect_linux(self) -> None:
         """Test detecting Linux platform."""
         with (
-            patch("platform.system", return_value="Linux"),
+            patch("ai_meta_orchestrator.infrastructure.platform._SYSTEM", "Linux"),
             patch(
                 "ai_meta_orchestrator.infrastructure.platform.detect_wsl",
                 return_value=False,
@@ -77,7 +112,7 @@ class TestDetectPlatform:
     def test_detect_wsl_platform(self) -> None:
         """Test detecting WSL platform."""
         with (
-            patch("platform.system", return_value="Linux"),
+            patch("ai_meta_orchestrator.infrastructure.platform._SYSTEM", "Linux"),
             patch(
                 "ai_meta_orchestrator.infrastructure.platform.detect_wsl",
                 return_value=True,
@@ -87,10 +122,32 @@ class TestDetectPlatform:
 
     def test_detect_unknown(self) -> None:
         """Test detecting unknown platform."""
-        with patch("platform.system", return_value="SomeOS"):
+        with patch("ai_meta_orchestrator.infrastructure.platform._SYSTEM", "SomeOS"):
             assert detect_platform() == Platform.UNKNOWN
 
 
+class TestDetectionCache:
+    """Tests for cached platform detection."""
+
+    def test_detect_platform_is_cached(self) -> None:
+        """Test that detection runs once until the cache is cleared."""
+        with patch("ai_meta_orchestrator.infrastructure.platform._SYSTEM", "Darwin"):
+            assert detect_platform() == Platform.MACOS
+        with patch("ai_meta_orchestrator.infrastructure.platform._SYSTEM", "Windows"):
+            assert detect_platform() == Platform.MACOS
+            detect_platform.cache_clear()
+            assert detect_platform() == Platform.WINDOWS
+
+
+class TestPlatformEnum:
+    """Tests for the Platform enum."""
+
+    def test_formats_as_value(self) -> None:
+        """Test that members format as their value."""
+        assert f"{Platform.WSL}" == "wsl"
+        assert str(Platform.MACOS) == "macos"
+
+
 class TestGetPlatformInfo:
     """Tests for getting platform information."""
 
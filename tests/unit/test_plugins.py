@@ -146,9 +146,9 @@ class MockHookPlugin(HookPlugin):
         )
 
     @property
-    def hook_points(self) -> list[HookPoint]:
+    def hook_points(self) -> frozenset[HookPoint]:
         """Get hook points."""
-        return [HookPoint.BEFORE_TASK_EXECUTE, HookPoint.AFTER_TASK_EXECUTE]
+        return frozenset({HookPoint.BEFORE_TASK_EXECUTE, HookPoint.AFTER_TASK_EXECUTE})
 
     def initialize(self, config: dict[str, Any]) -> bool:
         """Initialize the hook plugin."""
@@ -275,6 +275,18 @@ class TestPluginRegistry:
         assert len(tools) == 1
         assert isinstance(tools[0], ToolPlugin)
 
+    def test_unregister_updates_type_indexes(self) -> None:
+        """Test that unregistered plugins drop out of typed lookups."""
+        registry = PluginRegistry()
+        registry.register(MockAgentPlugin())
+        registry.register(MockToolPlugin())
+
+        registry.unregister("mock_agent")
+
+        assert registry.get_agent_plugins() == []
+        assert registry.get_by_type(PluginType.AGENT) == []
+        assert len(registry.get_tool_plugins()) == 1
+
     def test_trigger_hook(self) -> None:
         """Test triggering hooks."""
         registry = PluginRegistry()
@@ -288,6 +300,28 @@ class TestPluginRegistry:
         assert len(hook_plugin.hooks_called) == 1
         assert hook_plugin.hooks_called[0][0] == HookPoint.BEFORE_TASK_EXECUTE
 
+    def test_trigger_hook_only_dispatches_subscribers(self) -> None:
+        """Test that hooks only reach plugins subscribed to the hook point."""
+        registry = PluginRegistry()
+        hook_plugin = MockHookPlugin()
+        registry.register(hook_plugin)
+
+        registry.trigger_hook(HookPoint.ON_TASK_FAILURE, {})
+        registry.unregister("mock_hook")
+        registry.trigger_hook(HookPoint.BEFORE_TASK_EXECUTE, {})
+
+        assert hook_plugin.hooks_called == []
+
+    def test_trigger_unknown_hook_point_returns_context(self) -> None:
+        """Test that a hook point with no index entry leaves the context unchanged."""
+        registry = PluginRegistry()
+        registry.register(MockHookPlugin())
+        context = {"test": "value"}
+
+        result = registry.trigger_hook("custom_hook", context)  # type: ignore[arg-type]
+
+        assert result == {"test": "value"}
+
     def test_list_all(self) -> None:
         """Test listing all plugins."""
         registry = PluginRegistry()
@@ -12,15 +12,18 @@ from ai_meta_orchestrator.domain.tasks.task_models import (
     TaskStatus,
 )
 
+EXPECTED_STATUSES = frozenset(
+    {"pending", "in_progress", "completed", "failed", "needs_revision", "blocked"}
+)
+EXPECTED_PRIORITIES = frozenset({"low", "medium", "high", "critical"})
+
 
 class TestTaskStatus:
     """Tests for TaskStatus enumeration."""
 
     def test_all_statuses_defined(self) -> None:
         """Verify all expected task statuses are defined."""
-        expected = {"pending", "in_progress", "completed", "failed", "needs_revision", "blocked"}
-        actual = {status.value for status in TaskStatus}
-        assert actual == expected
+        assert frozenset(TaskStatus) == EXPECTED_STATUSES
 
 
 class TestTaskPriority:
@@ -28,9 +31,7 @@ class TestTaskPriority:
 
     def test_all_priorities_defined(self) -> None:
         """Verify all expected priorities are defined."""
-        expected = {"low", "medium", "high", "critical"}
-        actual = {priority.value for priority in TaskPriority}
-        assert actual == expected
+        assert frozenset(TaskPriority) == EXPECTED_PRIORITIES
 
 
 class TestTaskResult:
@@ -95,6 +96,11 @@ class TestTask:
         assert isinstance(task.id, UUID)
         assert isinstance(task.created_at, datetime)
 
+    def test_task_uses_slots(self) -> None:
+        """Test that tasks are slotted and carry no per-instance __dict__."""
+        task = Task(name="Slotted", description="Desc", assigned_to=AgentRole.DEV)
+        assert not hasattr(task, "__dict__")
+
     def test_mark_in_progress(self) -> None:
         """Test marking a task as in progress."""
         task = Task(
@@ -130,6 +136,17 @@ class TestTask:
         task.complete(result)
         assert task.status == TaskStatus.FAILED
 
+    def test_complete_task_with_falsy_success(self) -> None:
+        """Test that a non-bool falsy success marks the task failed."""
+        task = Task(
+            name="Test",
+            description="Test",
+            assigned_to=AgentRole.DEV,
+        )
+        result = TaskResult(success=None, error="Unknown")  # type: ignore[arg-type]
+        task.complete(result)
+        assert task.status == TaskStatus.FAILED
+
     def test_request_revision(self) -> None:
         """Test requesting a task revision."""
         task = Task(
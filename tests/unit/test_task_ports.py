@@ -0,0 +1,157 @@
+"""Unit tests for task port default implementations."""
+
+import threading
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from ai_meta_orchestrator.domain.tasks.task_models import Task, TaskResult
+from ai_meta_orchestrator.ports.task_ports.task_port import (
+    TaskDistributorPort,
+    TaskExecutorPort,
+)
+
+from ._factories import make_task
+
+
+class RecordingExecutor(TaskExecutorPort):
+    """Executor that records the order in which tasks are executed."""
+
+    def __init__(self) -> None:
+        """Initialize the recording executor."""
+        self.executed: list[str] = []
+        self._lock = threading.Lock()
+
+    def execute(self, task: Task) -> TaskResult:
+        """Record and complete the task."""
+        with self._lock:
+            self.executed.append(task.name)
+        result = TaskResult(success=True, output=task.name)
+        task.complete(result)
+        return result
+
+    def get_task_status(self, task_id: UUID) -> Task | None:
+        """Task lookup is not tracked."""
+        return None
+
+
+class SingleAgentDistributor(TaskDistributorPort):
+    """Distributor that assigns every task to the same agent."""
+
+    def __init__(self) -> None:
+        """Initialize the distributor with a single agent."""
+        self.agent_id = uuid4()
+        self.reassigned: list[str] = []
+
+    def distribute(self, tasks: list[Task]) -> dict[UUID, UUID]:
+        """Assign all tasks to the single agent."""
+        return {task.id: self.agent_id for task in tasks}
+
+    def reassign(self, task: Task, feedback: str) -> bool:
+        """Record the reassignment feedback."""
+        self.reassigned.append(feedback)
+        return True
+
+
+class TestTaskExecutorPort:
+    """Tests for TaskExecutorPort async defaults."""
+
+    @pytest.mark.asyncio
+    async def test_execute_async_delegates_to_execute(self) -> None:
+        """Test that execute_async runs the synchronous execute."""
+        executor = RecordingExecutor()
+        task = make_task(name="build")
+
+        result = await executor.execute_async(task)
+
+        assert result.success is True
+        assert executor.executed == ["build"]
+
+
+class TestTaskDistributorPort:
+    """Tests for TaskDistributorPort async defaults."""
+
+    @pytest.mark.asyncio
+    async def test_reassign_async_delegates_to_reassign(self) -> None:
+        """Test that reassign_async runs the synchronous reassign."""
+        distributor = SingleAgentDistributor()
+
+        assert await distributor.reassign_async(make_task(name="build"), "retry") is True
+        assert distributor.reassigned == ["retry"]
+
+    @pytest.mark.asyncio
+    async def test_distribute_async_respects_dependencies(self) -> None:
+        """Test that dependents only run after their dependencies finish."""
+        distributor = SingleAgentDistributor()
+        executor = RecordingExecutor()
+        plan = make_task(name="plan")
+        build = make_task(name="build", context_tasks=[plan.id])
+        docs = make_task(name="docs", context_tasks=[plan.id])
+        review = make_task(name="review", context_tasks=[build.id, docs.id])
+
+        events = [
+            event
+            async for event in distributor.distribute_async(
+                [review, docs, build, plan], executor, max_parallel=2
+            )
+        ]
+
+        assert executor.executed[0] == "plan"
+        assert executor.executed[-1] == "review"
+        assert [task_id for task_id, _ in events][-1] == review.id
+        assert {agent_id for _, agent_id in events} == {distributor.agent_id}
+        assert len(events) == 4
+
+    @pytest.mark.asyncio
+    async def test_distribute_async_reports_dependency_cycles(self) -> None:
+        """Test that tasks in a dependency cycle are reported, not dropped."""
+        distributor = SingleAgentDistributor()
+        executor = RecordingExecutor()
+        first = make_task(name="first")
+        second = make_task(name="second", context_tasks=[first.id])
+        first.context_tasks.append(second.id)
+        standalone = make_task(name="standalone")
+
+        events = []
+        with pytest.raises(ValueError, match="unresolvable dependencies") as exc_info:
+            async for event in distributor.distribute_async(
+                [first, second, standalone], executor
+            ):
+                events.append(event)
+
+        assert events == [(standalone.id, distributor.agent_id)]
+        assert str(first.id) in str(exc_info.value)
+        assert str(second.id) in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_distribute_async_rejects_unassigned_tasks(self) -> None:
+        """Test that unassigned tasks are rejected before anything executes."""
+        distributor = SingleAgentDistributor()
+        executor = RecordingExecutor()
+        assigned = make_task(name="assigned")
+        orphan = make_task(name="orphan")
+
+        with (
+            patch.object(
+                distributor,
+                "distribute",
+                return_value={assigned.id: distributor.agent_id},
+            ),
+            pytest.raises(ValueError, match=str(orphan.id)),
+        ):
+            async for _ in distributor.distribute_async([assigned, orphan], executor):
+                pass
+
+        assert executor.executed == []
+
+    @pytest.mark.asyncio
+    async def test_distribute_async_rejects_non_positive_max_parallel(self) -> None:
+        """Test that max_parallel must allow at least one task to run."""
+        distributor = SingleAgentDistributor()
+
+        with pytest.raises(ValueError, match="max_parallel"):
+            async for _ in distributor.distribute_async(
+                [make_task(name="build")], RecordingExecutor(), max_parallel=0
+            ):
+                pass
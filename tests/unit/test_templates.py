@@ -1,8 +1,11 @@
 """Unit tests for workflow templates."""
 
+from dataclasses import replace
+
 import pytest
 
 from ai_meta_orchestrator.adapters.templates import (
+    BUILTIN_TEMPLATES,
     create_full_development_template,
     get_default_template_registry,
 )
@@ -15,6 +18,12 @@ from ai_meta_orchestrator.domain.templates.template_models import (
 )
 
 
+@pytest.fixture(scope="module")
+def base_template() -> WorkflowTemplate:
+    """Shared read-only template; derive variants with dataclasses.replace."""
+    return WorkflowTemplate(name="Test", description="Test")
+
+
 class TestTaskTemplate:
     """Tests for TaskTemplate."""
 
@@ -76,6 +85,9 @@ class TestWorkflowTemplate:
         missing = template.validate_params({"a": "1", "b": "2", "c": "3"})
         assert missing == []
 
+        missing = template.validate_params({"b": "2"})
+        assert missing == ["a", "c"]
+
     def test_instantiate_workflow(self) -> None:
         """Test instantiating a workflow from template."""
         template = WorkflowTemplate(
@@ -115,12 +127,12 @@ class TestWorkflowTemplate:
 class TestWorkflowTemplateRegistry:
     """Tests for WorkflowTemplateRegistry."""
 
-    def test_register_template(self) -> None:
+    def test_register_template(self, base_template: WorkflowTemplate) -> None:
         """Test registering a template."""
         registry = WorkflowTemplateRegistry()
-        template = WorkflowTemplate(
+        template = replace(
+            base_template,
             name="My Template",
-            description="Test",
             category=TemplateCategory.DEVELOPMENT,
         )
 
@@ -128,15 +140,14 @@ class TestWorkflowTemplateRegistry:
 
         assert registry.get("My Template") == template
 
-    def test_register_duplicate_raises(self) -> None:
+    def test_register_duplicate_raises(self, base_template: WorkflowTemplate) -> None:
         """Test that registering duplicate name raises."""
         registry = WorkflowTemplateRegistry()
-        template = WorkflowTemplate(name="Test", description="Test")
 
-        registry.register(template)
+        registry.register(base_template)
 
         with pytest.raises(ValueError):
-            registry.register(template)
+            registry.register(replace(base_template))
 
     def test_get_by_category(self) -> None:
         """Test getting templates by category."""
@@ -180,11 +191,23 @@ class TestWorkflowTemplateRegistry:
         assert len(results) == 1
         assert results[0].name == "Template 1"
 
-    def test_unregister(self) -> None:
+    def test_search_by_tags_matches_any_in_registration_order(self) -> None:
+        """Test tag search unions tags, keeps order and forgets removed templates."""
+        registry = WorkflowTemplateRegistry()
+        for name, tags in [("A", ["api"]), ("B", ["web", "api"]), ("C", ["web"])]:
+            registry.register(WorkflowTemplate(name=name, description=name, tags=tags))
+
+        results = registry.search_by_tags(["web", "api"])
+        assert [t.name for t in results] == ["A", "B", "C"]
+
+        registry.unregister("B")
+        assert [t.name for t in registry.search_by_tags(["web"])] == ["C"]
+        assert registry.search_by_tags(["missing"]) == []
+
+    def test_unregister(self, base_template: WorkflowTemplate) -> None:
         """Test unregistering a template."""
         registry = WorkflowTemplateRegistry()
-        template = WorkflowTemplate(name="Test", description="Test")
-        registry.register(template)
+        registry.register(base_template)
 
         result = registry.unregister("Test")
 
@@ -192,6 +215,18 @@ class TestWorkflowTemplateRegistry:
         assert registry.get("Test") is None
 
 
+    def test_unregister_after_tags_change(self) -> None:
+        """Test unregistering a template whose tags changed after registration."""
+        registry = WorkflowTemplateRegistry()
+        template = WorkflowTemplate(name="Tagged", description="Tagged", tags=["x"])
+        registry.register(template)
+        template.tags.append("y")
+        template.tags.remove("x")
+
+        assert registry.unregister("Tagged") is True
+        assert registry.search_by_tags(["x", "y"]) == []
+
+
 class TestBuiltinTemplates:
     """Tests for built-in templates."""
 
@@ -215,6 +250,35 @@ class TestBuiltinTemplates:
         assert any(t.name == "Quick Implementation" for t in templates)
         assert any(t.name == "Code Review Workflow" for t in templates)
 
+    def test_builtin_templates_is_read_only(self) -> None:
+        """Test that the built-in template mapping cannot be modified."""
+        assert "Full Development Workflow" in BUILTIN_TEMPLATES
+        with pytest.raises(TypeError):
+            BUILTIN_TEMPLATES["Custom"] = create_full_development_template()  # type: ignore[index]
+
+    def test_default_registry_uses_builtin_templates(self) -> None:
+        """Test that the default registry serves the prebuilt templates."""
+        registry = get_default_template_registry()
+
+        assert registry.list_all() == list(BUILTIN_TEMPLATES.values())
+
+    def test_default_registries_are_independent(self) -> None:
+        """Test that changes to one default registry do not leak into others."""
+        registry = get_default_template_registry()
+        registry.unregister("Quick Implementation")
+        registry.register(
+            WorkflowTemplate(
+                name="Custom",
+                description="Custom",
+                category=TemplateCategory.CUSTOM,
+            )
+        )
+
+        fresh = get_default_template_registry()
+
+        assert fresh is not registry
+        assert fresh.list_all() == list(BUILTIN_TEMPLATES.values())
+
     def test_full_development_instantiation(self) -> None:
         """Test instantiating the full development template."""
         template = create_full_development_template()
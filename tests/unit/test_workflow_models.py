@@ -1,7 +1,11 @@
 """Unit tests for domain workflow models."""
 
+import dataclasses
+from unittest.mock import patch
 from uuid import uuid4
 
+import pytest
+
 from ai_meta_orchestrator.domain.agents.agent_models import AgentRole
 from ai_meta_orchestrator.domain.tasks.task_models import Task, TaskStatus
 from ai_meta_orchestrator.domain.workflows.workflow_models import (
@@ -12,15 +16,24 @@ from ai_meta_orchestrator.domain.workflows.workflow_models import (
     WorkflowStatus,
 )
 
+from ._factories import make_task, make_workflow
+
+EXPECTED_STATUSES = frozenset({"not_started", "running", "paused", "completed", "failed"})
+EXPECTED_MODES = frozenset({"sequential", "parallel", "hierarchical"})
+
+
+@pytest.fixture
+def workflow() -> Workflow:
+    """Return a fresh, empty workflow."""
+    return make_workflow()
+
 
 class TestWorkflowStatus:
     """Tests for WorkflowStatus enumeration."""
 
     def test_all_statuses_defined(self) -> None:
         """Verify all expected workflow statuses are defined."""
-        expected = {"not_started", "running", "paused", "completed", "failed"}
-        actual = {status.value for status in WorkflowStatus}
-        assert actual == expected
+        assert frozenset(WorkflowStatus) == EXPECTED_STATUSES
 
 
 class TestWorkflowMode:
@@ -28,9 +41,7 @@ class TestWorkflowMode:
 
     def test_all_modes_defined(self) -> None:
         """Verify all expected workflow modes are defined."""
-        expected = {"sequential", "parallel", "hierarchical"}
-        actual = {mode.value for mode in WorkflowMode}
-        assert actual == expected
+        assert frozenset(WorkflowMode) == EXPECTED_MODES
 
 
 class TestWorkflowConfig:
@@ -84,6 +95,15 @@ class TestWorkflowResult:
         assert result.success is False
         assert len(result.errors) == 2
 
+    def test_increment_counters(self) -> None:
+        """Test accumulating task outcomes on a live result."""
+        result = WorkflowResult(success=False)
+        result.increment_completed()
+        result.increment_completed()
+        result.increment_failed()
+        assert result.tasks_completed == 2
+        assert result.tasks_failed == 1
+
 
 class TestWorkflow:
     """Tests for Workflow dataclass."""
@@ -99,9 +119,13 @@ class TestWorkflow:
         assert workflow.tasks == []
         assert workflow.current_iteration == 0
 
-    def test_add_task(self) -> None:
+    def test_workflow_uses_slots(self, workflow: Workflow) -> None:
+        """Test that workflows are slotted and carry no per-instance __dict__."""
+        assert not hasattr(workflow, "__dict__")
+        assert not hasattr(workflow.config, "__dict__")
+
+    def test_add_task(self, workflow: Workflow) -> None:
         """Test adding a task to workflow."""
-        workflow = Workflow(name="Test", description="Test")
         task = Task(
             name="Task 1",
             description="First task",
@@ -113,9 +137,8 @@ class TestWorkflow:
         assert len(workflow.tasks) == 1
         assert workflow.tasks[0] == task
 
-    def test_get_task_by_id(self) -> None:
+    def test_get_task_by_id(self, workflow: Workflow) -> None:
         """Test getting a task by ID."""
-        workflow = Workflow(name="Test", description="Test")
         task = Task(
             name="Task 1",
             description="First task",
@@ -127,18 +150,57 @@ class TestWorkflow:
 
         assert found == task
 
-    def test_get_task_by_id_not_found(self) -> None:
-        """Test getting a non-existent task."""
-        workflow = Workflow(name="Test", description="Test")
+    def test_get_task_by_id_finds_unindexed_tasks(self) -> None:
+        """Test lookup of tasks passed to the constructor or appended directly."""
+        initial = make_task(name="Initial")
+        workflow = make_workflow(tasks=[initial])
+        appended = make_task(name="Appended")
+        workflow.tasks.append(appended)
+
+        assert workflow.get_task_by_id(initial.id) is initial
+        assert workflow.get_task_by_id(appended.id) is appended
+
+    def test_get_task_by_id_ignores_removed_tasks(self, workflow: Workflow) -> None:
+        """Test that tasks removed or replaced directly are no longer found."""
+        done = make_task(name="Done", status=TaskStatus.COMPLETED)
+        waiting = make_task(name="Waiting", context_tasks=[done.id])
+        workflow.add_task(done)
+        workflow.add_task(waiting)
+
+        workflow.tasks.remove(done)
 
+        assert workflow.get_task_by_id(done.id) is None
+        assert workflow.get_task_by_id(waiting.id) is waiting
+        assert workflow.get_ready_tasks() == []
+
+        workflow.tasks = []
+        assert workflow.get_task_by_id(waiting.id) is None
+
+    def test_task_index_not_a_field(self, workflow: Workflow) -> None:
+        """Test that the task index stays out of asdict output."""
+        workflow.add_task(make_task())
+
+        assert set(dataclasses.asdict(workflow)) == {
+            f.name for f in dataclasses.fields(Workflow)
+        }
+
+    def test_get_task_by_id_not_found(self, workflow: Workflow) -> None:
+        """Test getting a non-existent task."""
         found = workflow.get_task_by_id(uuid4())
 
         assert found is None
 
-    def test_get_pending_tasks(self) -> None:
-        """Test getting pending tasks."""
-        workflow = Workflow(name="Test", description="Test")
+    def test_get_task_by_id_miss_does_not_reindex(self, workflow: Workflow) -> None:
+        """Test that looking up an absent ID leaves an up-to-date index alone."""
+        workflow.add_task(make_task())
+
+        with patch.object(Workflow, "_reindex_tasks") as reindex:
+            assert workflow.get_task_by_id(uuid4()) is None
+
+        reindex.assert_not_called()
 
+    def test_get_pending_tasks(self, workflow: Workflow) -> None:
+        """Test getting pending tasks."""
         task1 = Task(name="Task 1", description="First", assigned_to=AgentRole.DEV)
         task2 = Task(name="Task 2", description="Second", assigned_to=AgentRole.QA)
         task2.status = TaskStatus.COMPLETED
@@ -151,18 +213,15 @@ class TestWorkflow:
         assert len(pending) == 1
         assert pending[0] == task1
 
-    def test_start_workflow(self) -> None:
+    def test_start_workflow(self, workflow: Workflow) -> None:
         """Test starting a workflow."""
-        workflow = Workflow(name="Test", description="Test")
-
         workflow.start()
 
         assert workflow.status == WorkflowStatus.RUNNING
         assert workflow.started_at is not None
 
-    def test_complete_workflow(self) -> None:
+    def test_complete_workflow(self, workflow: Workflow) -> None:
         """Test completing a workflow."""
-        workflow = Workflow(name="Test", description="Test")
         result = WorkflowResult(success=True, tasks_completed=1)
 
         workflow.complete(result)
@@ -171,18 +230,24 @@ class TestWorkflow:
         assert workflow.result == result
         assert workflow.completed_at is not None
 
-    def test_complete_workflow_with_failure(self) -> None:
+    def test_complete_workflow_with_failure(self, workflow: Workflow) -> None:
         """Test completing a workflow with failures."""
-        workflow = Workflow(name="Test", description="Test")
         result = WorkflowResult(success=False, tasks_failed=1)
 
         workflow.complete(result)
 
         assert workflow.status == WorkflowStatus.FAILED
 
-    def test_increment_iteration(self) -> None:
+    def test_complete_workflow_with_falsy_success(self, workflow: Workflow) -> None:
+        """Test that a non-bool falsy success marks the workflow failed."""
+        result = WorkflowResult(success=None)  # type: ignore[arg-type]
+
+        workflow.complete(result)
+
+        assert workflow.status == WorkflowStatus.FAILED
+
+    def test_increment_iteration(self, workflow: Workflow) -> None:
         """Test incrementing workflow iteration."""
-        workflow = Workflow(name="Test", description="Test")
         workflow.config.max_iterations = 3
 
         assert workflow.increment_iteration() is True
@@ -198,9 +263,8 @@ class TestWorkflow:
         assert workflow.increment_iteration() is False
         assert workflow.current_iteration == 3
 
-    def test_is_complete(self) -> None:
+    def test_is_complete(self, workflow: Workflow) -> None:
         """Test checking if workflow is complete."""
-        workflow = Workflow(name="Test", description="Test")
         task1 = Task(name="Task 1", description="First", assigned_to=AgentRole.DEV)
         task2 = Task(name="Task 2", description="Second", assigned_to=AgentRole.QA)
 
@@ -215,9 +279,8 @@ class TestWorkflow:
         task2.status = TaskStatus.FAILED
         assert workflow.is_complete() is True
 
-    def test_get_progress(self) -> None:
+    def test_get_progress(self, workflow: Workflow) -> None:
         """Test getting workflow progress."""
-        workflow = Workflow(name="Test", description="Test")
         task1 = Task(name="Task 1", description="First", assigned_to=AgentRole.DEV)
         task2 = Task(name="Task 2", description="Second", assigned_to=AgentRole.QA)
         task3 = Task(name="Task 3", description="Third", assigned_to=AgentRole.DOCS)
@@ -237,41 +300,48 @@ class TestWorkflow:
         assert completed == 2
         assert total == 3
 
-    def test_pause_workflow(self) -> None:
-        """Test pausing a running workflow."""
-        workflow = Workflow(name="Test", description="Test")
-        workflow.start()
-
-        assert workflow.pause() is True
-        assert workflow.status == WorkflowStatus.PAUSED
-
-    def test_pause_workflow_not_running(self) -> None:
-        """Test pausing a workflow that is not running."""
-        workflow = Workflow(name="Test", description="Test")
-        # Workflow is NOT_STARTED
-        assert workflow.pause() is False
-        assert workflow.status == WorkflowStatus.NOT_STARTED
-
-    def test_resume_workflow(self) -> None:
-        """Test resuming a paused workflow."""
-        workflow = Workflow(name="Test", description="Test")
-        workflow.start()
-        workflow.pause()
-
-        assert workflow.resume() is True
-        assert workflow.status == WorkflowStatus.RUNNING
-
-    def test_resume_workflow_not_paused(self) -> None:
-        """Test resuming a workflow that is not paused."""
-        workflow = Workflow(name="Test", description="Test")
-        workflow.start()
-        # Workflow is RUNNING, not PAUSED
-        assert workflow.resume() is False
-        assert workflow.status == WorkflowStatus.RUNNING
-
-    def test_get_ready_tasks_no_dependencies(self) -> None:
+    @pytest.mark.parametrize(
+        ("initial_status", "expected_ok", "final_status"),
+        [
+            (WorkflowStatus.RUNNING, True, WorkflowStatus.PAUSED),
+            (WorkflowStatus.NOT_STARTED, False, WorkflowStatus.NOT_STARTED),
+        ],
+    )
+    def test_pause(
+        self,
+        workflow: Workflow,
+        initial_status: WorkflowStatus,
+        expected_ok: bool,
+        final_status: WorkflowStatus,
+    ) -> None:
+        """Test that only running workflows can be paused."""
+        workflow.status = initial_status
+
+        assert workflow.pause() is expected_ok
+        assert workflow.status == final_status
+
+    @pytest.mark.parametrize(
+        ("initial_status", "expected_ok", "final_status"),
+        [
+            (WorkflowStatus.PAUSED, True, WorkflowStatus.RUNNING),
+            (WorkflowStatus.RUNNING, False, WorkflowStatus.RUNNING),
+        ],
+    )
+    def test_resume(
+        self,
+        workflow: Workflow,
+        initial_status: WorkflowStatus,
+        expected_ok: bool,
+        final_status: WorkflowStatus,
+    ) -> None:
+        """Test that only paused workflows can be resumed."""
+        workflow.status = initial_status
+
+        assert workflow.resume() is expected_ok
+        assert workflow.status == final_status
+
+    def test_get_ready_tasks_no_dependencies(self, workflow: Workflow) -> None:
         """Test getting ready tasks when tasks have no dependencies."""
-        workflow = Workflow(name="Test", description="Test")
         task1 = Task(name="Task 1", description="First", assigned_to=AgentRole.DEV)
         task2 = Task(name="Task 2", description="Second", assigned_to=AgentRole.QA)
 
@@ -281,9 +351,8 @@ class TestWorkflow:
         ready = workflow.get_ready_tasks()
         assert len(ready) == 2
 
-    def test_get_ready_tasks_with_dependencies(self) -> None:
+    def test_get_ready_tasks_with_dependencies(self, workflow: Workflow) -> None:
         """Test getting ready tasks with dependencies."""
-        workflow = Workflow(name="Test", description="Test")
         task1 = Task(name="Task 1", description="First", assigned_to=AgentRole.DEV)
         task2 = Task(
             name="Task 2",
@@ -319,9 +388,21 @@ class TestWorkflow:
         assert len(ready) == 1
         assert ready[0] == task3
 
-    def test_get_ready_tasks_all_completed(self) -> None:
+    def test_iter_ready_tasks_is_lazy(self, workflow: Workflow) -> None:
+        """Test that ready tasks are yielded in order and unknown deps block."""
+        first = make_task(name="First")
+        blocked = make_task(name="Blocked", context_tasks=[uuid4()])
+        second = make_task(name="Second")
+        for task in (first, blocked, second):
+            workflow.add_task(task)
+
+        ready = workflow.iter_ready_tasks()
+
+        assert next(ready) is first
+        assert list(ready) == [second]
+
+    def test_get_ready_tasks_all_completed(self, workflow: Workflow) -> None:
         """Test getting ready tasks when all are completed."""
-        workflow = Workflow(name="Test", description="Test")
         task1 = Task(name="Task 1", description="First", assigned_to=AgentRole.DEV)
         task1.status = TaskStatus.COMPLETED
 
@@ -0,0 +1,78 @@
+"""Micro-benchmarks for workflow scheduling queries.
+
+Run with ``pytest tests/unit/test_workflow_models_bench.py``. The module is
+skipped when pytest-benchmark is not installed.
+"""
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from ai_meta_orchestrator.domain.tasks.task_models import TaskStatus
+from ai_meta_orchestrator.domain.workflows.workflow_models import Workflow
+
+from ._factories import make_task, make_workflow
+
+pytest.importorskip("pytest_benchmark")
+
+WORKFLOW_SIZES = [2, 50, 500]
+# Fixed rounds keep the benchmarks cheap enough to run with the unit suite
+PEDANTIC: dict[str, Any] = {"rounds": 20, "iterations": 10}
+
+
+@pytest.fixture(params=WORKFLOW_SIZES, ids=lambda size: f"tasks={size}")
+def chained_workflow(request: pytest.FixtureRequest) -> Workflow:
+    """Build a dependency chain whose first half has already completed."""
+    size: int = request.param
+    workflow = make_workflow(name="Bench")
+    previous = None
+    for i in range(size):
+        task = make_task(
+            name=f"Task {i}",
+            context_tasks=[previous.id] if previous else [],
+        )
+        if i < size // 2:
+            task.status = TaskStatus.COMPLETED
+        workflow.add_task(task)
+        previous = task
+    return workflow
+
+
+@pytest.fixture(params=WORKFLOW_SIZES, ids=lambda size: f"tasks={size}")
+def unknown_deps_workflow(request: pytest.FixtureRequest) -> Workflow:
+    """Build pending tasks that each depend on a task outside the workflow."""
+    size: int = request.param
+    workflow = make_workflow(name="Bench")
+    for i in range(size):
+        workflow.add_task(make_task(name=f"Task {i}", context_tasks=[uuid4()]))
+    return workflow
+
+
+class TestWorkflowBenchmarks:
+    """Benchmarks for Workflow scheduling queries."""
+
+    def test_get_ready_tasks(self, benchmark: Any, chained_workflow: Workflow) -> None:
+        """Benchmark resolving the ready set of a partially completed chain."""
+        ready = benchmark.pedantic(chained_workflow.get_ready_tasks, **PEDANTIC)
+        assert len(ready) == 1
+
+    def test_get_ready_tasks_unknown_dependencies(
+        self, benchmark: Any, unknown_deps_workflow: Workflow
+    ) -> None:
+        """Benchmark a ready scan where every dependency is outside the workflow."""
+        ready = benchmark.pedantic(unknown_deps_workflow.get_ready_tasks, **PEDANTIC)
+        assert ready == []
+
+    def test_get_task_by_id(self, benchmark: Any, chained_workflow: Workflow) -> None:
+        """Benchmark looking up the last task in the workflow by ID."""
+        last = chained_workflow.tasks[-1]
+        found = benchmark.pedantic(
+            chained_workflow.get_task_by_id, args=(last.id,), **PEDANTIC
+        )
+        assert found is last
+
+    def test_get_progress(self, benchmark: Any, chained_workflow: Workflow) -> None:
+        """Benchmark counting finished tasks."""
+        completed, total = benchmark.pedantic(chained_workflow.get_progress, **PEDANTIC)
+        assert (completed, total) == (total // 2, total)